@@ -4,16 +4,232 @@ AI辅助文章过滤模块
 使用AI模型对文章进行智能筛选和评估
 """
 
+import functools
+import hashlib
 import json
 import os
 import logging
+import re
 import yaml
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
+from .llm_cache import LLMCache, DEFAULT_CACHE_TTL
+
+# orjson为可选依赖，未安装时使用标准库json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+
+def _json_dumps(obj: Any) -> bytes:
+    """序列化为UTF-8编码的JSON字节串"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+
+def _json_loads(data: Any) -> Any:
+    """解析JSON字符串或字节串"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_env(name: str) -> str:
+    """读取环境变量，成功读取的值在进程内缓存，未设置时抛出ValueError"""
+    value = os.getenv(name)
+    if not value:
+        raise ValueError(f"环境变量 {name} 未设置")
+    return value
+
+
+# 批量请求的默认最大生成token数，常见提供商的输出上限为8192
+DEFAULT_BATCH_MAX_TOKENS = 8192
+
+# 单篇文章请求的默认超时时间（秒），批量请求按文章数成比例增加
+DEFAULT_REQUEST_TIMEOUT = 30
+
+# 批量评估时替代单篇文章字段的占位文本
+_BATCH_PLACEHOLDER = "(see the Articles list below)"
+
+# 批量评估的固定说明，放在文章数据之前以便提供商缓存不变的提示词前缀
+_BATCH_INSTRUCTIONS = """
+
+Batch Instructions:
+- The article information is provided as a JSON array in the "Articles" section below
+- Evaluate EACH article independently using the criteria above
+- Return JSON only, with one result per article, using the same fields as above plus the article "id":
+{"results": [{"id": 1, "relevant": true/false, "score": 1-10, "description": "...", "application_areas": ["..."]}]}
+
+Articles:
+"""
+
+# 演示模式的核心应用领域: (领域名称, 英文描述, 关键词)
+_DEMO_AREAS = [
+    ("phenotype from genotype", "predicts phenotypes from genotype data",
+     ('phenotype', 'genotype', 'phenotype from genotype')),
+    ("life cycle simulation", "simulates life cycle processes",
+     ('life cycle', 'lifecycle', 'simulation')),
+    ("cell cycle regulator", "studies cell cycle regulation",
+     ('cell cycle', 'cell cycle regulator')),
+    ("single-cell multi-omics", "integrates single-cell multi-omics data",
+     ('single-cell', 'single cell', 'multi-omics', 'multiomics')),
+    ("scATAC-seq", "analyzes scATAC-seq data",
+     ('scatac-seq', 'scatac')),
+    ("scRNA-seq", "analyzes scRNA-seq data",
+     ('scrna-seq', 'scrna')),
+    ("chromatin accessibility", "studies chromatin accessibility",
+     ('chromatin accessibility', 'chromatin access')),
+    ("gene regulatory network", "models gene regulatory networks",
+     ('gene regulatory', 'regulatory network')),
+    ("enhancer-gene linking", "links enhancers to genes",
+     ('enhancer', 'enhancer-gene', 'enhancer gene')),
+    ("chromatin potential", "analyzes chromatin potential",
+     ('chromatin potential',)),
+    ("GWAS variant enrichment", "performs GWAS variant enrichment",
+     ('gwas', 'variant enrichment')),
+    ("eQTL", "conducts eQTL analysis",
+     ('eqtl',)),
+    ("metabolomics analysis", "analyzes metabolomics data",
+     ('metabolomics', 'metabolome', 'metabolic profiling', 'metabolite')),
+    ("proteomics analysis", "analyzes proteomics data",
+     ('proteomics', 'proteome', 'protein identification', 'protein quantification')),
+    ("computational metabolomics", "develops computational methods for metabolomics",
+     ('computational metabolomics', 'metabolomics algorithm', 'metabolomics method')),
+    ("computational proteomics", "develops computational methods for proteomics",
+     ('computational proteomics', 'proteomics algorithm', 'proteomics method')),
+    ("virtual cell", "creates virtual cell models and simulations",
+     ('virtual cell', 'cell simulation', 'cellular modeling', 'in silico cell')),
+    ("aging", "studies aging processes and mechanisms",
+     ('aging', 'ageing', 'senescence', 'longevity', 'aging biology')),
+    ("foundation model", "develops foundation models for biological data",
+     ('foundation model', 'foundational model', 'multimodal foundation model',
+      'biology foundation model', 'omics foundation model')),
+]
+
+# 演示模式领域描述的中文翻译
+_ZH_DESCRIPTIONS = {
+    "predicts phenotypes from genotype data": "预测基因型到表型",
+    "simulates life cycle processes": "模拟生命周期过程",
+    "studies cell cycle regulation": "研究细胞周期调控",
+    "integrates single-cell multi-omics data": "整合单细胞多组学数据",
+    "analyzes scATAC-seq data": "分析scATAC-seq数据",
+    "analyzes scRNA-seq data": "分析scRNA-seq数据",
+    "studies chromatin accessibility": "研究染色质可及性",
+    "models gene regulatory networks": "建模基因调控网络",
+    "links enhancers to genes": "连接增强子到基因",
+    "analyzes chromatin potential": "分析染色质潜力",
+    "performs GWAS variant enrichment": "进行GWAS变异富集分析",
+    "conducts eQTL analysis": "进行eQTL分析",
+    "analyzes metabolomics data": "分析代谢组学数据",
+    "analyzes proteomics data": "分析蛋白质组学数据",
+    "develops computational methods for metabolomics": "开发代谢组学计算方法",
+    "develops computational methods for proteomics": "开发蛋白质组学计算方法",
+    "creates virtual cell models and simulations": "创建虚拟细胞模型和模拟",
+    "studies aging processes and mechanisms": "研究衰老过程和机制",
+    "develops foundation models for biological data": "开发生物数据基础模型",
+}
+
+# 演示模式的主题分类关键词，按优先级排列
+_DEMO_TOPICS = [
+    ("single-cell", ('single-cell', 'single cell', 'scrna', 'scatac')),
+    ("genomics", ('genomics', 'genome', 'genomic', 'dna', 'rna')),
+    ("proteomics", ('proteomics', 'proteome', 'protein')),
+    ("metabolomics", ('metabolomics', 'metabolome', 'metabolic')),
+    ("network", ('network', 'regulatory network', 'gene regulatory')),
+    ("simulation", ('simulation', 'modeling', 'virtual cell')),
+    ("foundation_model", ('foundation model', 'foundational model', 'llm', 'language model')),
+    ("aging", ('aging', 'ageing', 'senescence')),
+]
+
+
+def _build_keyword_index(keywords):
+    """
+    预处理关键词，使每个关键词在每篇文章中最多只检查一次
+
+    包含其他关键词的长关键词（如 "computational metabolomics" 包含 "metabolomics"）
+    只有在其包含的最短关键词出现时才需要检查，结果与逐个 `in` 判断完全一致。
+
+    Args:
+        keywords: 关键词列表（可重复）
+
+    Returns:
+        Tuple[List[str], List[Tuple[str, str]]]: 基础关键词列表，以及 (长关键词, 前置关键词) 列表
+    """
+    unique = sorted(set(keywords), key=len)
+    base = []
+    dependent = []
+    for kw in unique:
+        contained = [other for other in unique if other != kw and other in kw]
+        if contained:
+            dependent.append((kw, min(contained, key=len)))
+        else:
+            base.append(kw)
+    return base, dependent
+
+
+_DEMO_BASE_KEYWORDS, _DEMO_DEPENDENT_KEYWORDS = _build_keyword_index(
+    [kw for _, _, keywords in _DEMO_AREAS for kw in keywords] +
+    [kw for _, keywords in _DEMO_TOPICS for kw in keywords]
+)
+
+
+# 每个关键词对应的位掩码：低位为应用领域，高位为主题
+_DEMO_TOPIC_SHIFT = len(_DEMO_AREAS)
+_DEMO_KEYWORD_MASKS: Dict[str, int] = {}
+for _bit, (_, _, _keywords) in enumerate(_DEMO_AREAS):
+    for _kw in _keywords:
+        _DEMO_KEYWORD_MASKS[_kw] = _DEMO_KEYWORD_MASKS.get(_kw, 0) | (1 << _bit)
+for _bit, (_, _keywords) in enumerate(_DEMO_TOPICS, _DEMO_TOPIC_SHIFT):
+    for _kw in _keywords:
+        _DEMO_KEYWORD_MASKS[_kw] = _DEMO_KEYWORD_MASKS.get(_kw, 0) | (1 << _bit)
+
+
+# 所有应用领域位的掩码
+_DEMO_AREA_MASK = (1 << _DEMO_TOPIC_SHIFT) - 1
+
+
+def _scan_keywords(text: str) -> set:
+    """
+    扫描文本，返回其中出现的所有演示模式关键词
+
+    Args:
+        text: 小写文本
+
+    Returns:
+        set: 出现的关键词集合
+    """
+    found = {kw for kw in _DEMO_BASE_KEYWORDS if kw in text}
+    if found:
+        found.update(kw for kw, required in _DEMO_DEPENDENT_KEYWORDS if required in found and kw in text)
+    return found
+
+
+def _scan_keyword_mask(text: str) -> int:
+    """
+    扫描文本，返回命中的应用领域和主题位掩码
+
+    Args:
+        text: 小写文本
+
+    Returns:
+        int: 位掩码，第i位表示 _DEMO_AREAS[i] 命中，_DEMO_TOPIC_SHIFT 以上的位对应 _DEMO_TOPICS
+    """
+    mask = 0
+    for kw in _scan_keywords(text):
+        mask |= _DEMO_KEYWORD_MASKS[kw]
+    return mask
+
+
 class AIFilter:
     """AI过滤器类"""
 
@@ -41,13 +257,56 @@ class AIFilter:
             
         self.temperature = config['model']['temperature']
         self.max_tokens = config['model']['max_tokens']
+        self.batch_max_tokens = int(config['model'].get('batch_max_tokens', DEFAULT_BATCH_MAX_TOKENS))
+        self.request_timeout = float(config.get('request_timeout', DEFAULT_REQUEST_TIMEOUT))
         self.prompt_template = config['prompt']
         self.language = config.get('language', 'zh')  # 默认中文
+        # 语言相关的替换与文章无关，只需处理一次
+        self._prepared_template = self._localize_prompt_template(self.prompt_template)
+        self.concurrency = max(1, int(config.get('concurrency', 8)))  # 并发评估数
+        # 单次请求评估的文章数，每篇文章需要 max_tokens 的输出空间，总量不超过 batch_max_tokens
+        self.batch_size = max(1, min(int(config.get('batch_size', 10)),
+                                     self.batch_max_tokens // max(1, self.max_tokens)))
+        # 是否启用关键词预过滤，关键词来自内置的核心应用领域，需显式开启
+        self.prefilter = config.get('prefilter', False)
+        self.prefilter_threshold = int(config.get('prefilter_threshold', 1))  # 至少命中的领域数
+
+        # 按提供商选择API调用方法，未知提供商使用通用方法（适用于所有OpenAI兼容的API）
+        self._call = self._PROVIDER_DISPATCH.get(
+            self.provider.lower(), type(self)._call_generic_api
+        ).__get__(self, type(self))
 
         # 验证配置
         if not self.demo_mode and not self.api_key:
             raise ValueError("API key未设置，请在配置文件中设置或设置环境变量，或启用demo_mode")
 
+        # 复用HTTP连接，避免每次请求重新进行TCP和TLS握手
+        self._session = requests.Session()
+        self._session.headers.update({
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        })
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=max(32, self.concurrency),
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=frozenset(["POST"])
+            )
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+        # AI响应缓存（演示模式下无需缓存）
+        self.cache = None
+        if config.get('cache_enabled', True) and not self.demo_mode:
+            self.cache = LLMCache(
+                config.get('cache_path', '.llm_cache.sqlite'),
+                config.get('cache_ttl', DEFAULT_CACHE_TTL)
+            )
+
     def _resolve_api_key(self, api_key_config: str) -> str:
         """
         解析API key，支持环境变量
@@ -59,17 +318,16 @@ class AIFilter:
             str: 解析后的API key
         """
         if api_key_config.startswith("${") and api_key_config.endswith("}"):
-            env_var = api_key_config[2:-1]
-            api_key = os.getenv(env_var)
-            if not api_key:
-                raise ValueError(f"环境变量 {env_var} 未设置")
-            return api_key
+            return _get_env(api_key_config[2:-1])
         return api_key_config
 
     def filter_articles(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         使用AI过滤文章列表
 
+        AI评估结果直接写入每篇文章的 `ai_evaluation` 字段（原地修改，不复制文章），
+        被过滤掉的文章同样会带有该字段。
+
         Args:
             articles: 文章列表
 
@@ -80,43 +338,253 @@ class AIFilter:
             logger.info("AI过滤已禁用，返回所有文章")
             return articles
 
-        logger.info(f"开始AI过滤，共 {len(articles)} 篇文章")
+        logger.info(f"开始AI过滤，共 {len(articles)} 篇文章 (并发数: {self.concurrency})")
+
+        # 并发评估所有文章，结果顺序与输入一致
+        evaluations = self._evaluate_articles(articles)
 
         filtered_articles = []
+        total = len(articles)
 
-        for i, article in enumerate(articles):
-            logger.info(f"AI评估文章 {i+1}/{len(articles)}: {article['title'][:50]}...")
-
-            try:
-                # AI评估文章
-                ai_result = self._evaluate_article(article)
-
-                # 添加AI评估结果到文章
-                article_with_ai = article.copy()
-                article_with_ai['ai_evaluation'] = ai_result
-
-                # 如果文章相关，添加到结果中
-                if ai_result.get('relevant', False):
-                    filtered_articles.append(article_with_ai)
-                    logger.info(f"✓ 文章通过AI过滤 (评分: {ai_result.get('score', 0)})")
-                else:
-                    logger.info(f"✗ 文章被AI过滤 (评分: {ai_result.get('score', 0)})")
-
-            except Exception as e:
-                logger.error(f"AI评估文章失败: {e}")
-                # 如果AI评估失败，默认保留文章
-                article_with_ai = article.copy()
-                article_with_ai['ai_evaluation'] = {
-                    'relevant': True,  # 默认保留
-                    'score': 5,
-                    'reason': f'AI评估失败: {str(e)}',
-                    'tags': []
-                }
-                filtered_articles.append(article_with_ai)
+        for i, (article, ai_result) in enumerate(zip(articles, evaluations)):
+            logger.info("AI评估文章 %d/%d: %.50s...", i + 1, total, article['title'])
+
+            # 添加AI评估结果到文章
+            article['ai_evaluation'] = ai_result
+
+            # 如果文章相关，添加到结果中
+            if ai_result.get('relevant', False):
+                filtered_articles.append(article)
+                logger.info("✓ 文章通过AI过滤 (评分: %s)", ai_result.get('score', 0))
+            else:
+                logger.info("✗ 文章被AI过滤 (评分: %s)", ai_result.get('score', 0))
 
         logger.info(f"AI过滤完成，保留 {len(filtered_articles)}/{len(articles)} 篇文章")
+        if self.cache is not None:
+            self.cache.log_stats()
         return filtered_articles
 
+    def _evaluate_articles(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        评估文章列表，重复文章只评估一次
+
+        同一篇文章可能被多个期刊或BioRxiv重复收录，按DOI（或标题+第一作者）去重后
+        只评估每组中的第一篇，其余文章复制该评估结果。
+
+        Args:
+            articles: 文章列表
+
+        Returns:
+            List[Dict]: 与输入顺序一致的AI评估结果列表
+        """
+        groups: Dict[str, List[int]] = {}
+        for i, article in enumerate(articles):
+            groups.setdefault(self._article_key(article), []).append(i)
+
+        if len(groups) < len(articles):
+            logger.info(f"🔁 文章去重: 共 {len(articles)} 篇，唯一 {len(groups)} 篇")
+
+        representatives = [indices[0] for indices in groups.values()]
+        results = self._evaluate_unique_articles([articles[i] for i in representatives])
+
+        evaluations: List[Optional[Dict[str, Any]]] = [None] * len(articles)
+        for indices, result in zip(groups.values(), results):
+            evaluations[indices[0]] = result
+            for i in indices[1:]:
+                evaluations[i] = dict(result)
+
+        return evaluations
+
+    @staticmethod
+    def _article_key(article: Dict[str, Any]) -> str:
+        """
+        计算文章的去重键
+
+        Args:
+            article: 文章信息
+
+        Returns:
+            str: 有DOI时为小写DOI，否则为规范化标题和第一作者的哈希
+        """
+        doi = (article.get('doi') or '').strip().lower()
+        if doi:
+            return doi
+
+        title = ' '.join(re.findall(r'\w+', (article.get('title') or '').lower()))
+        authors = article.get('authors') or ['']
+        digest = hashlib.blake2b(f"{title}|{authors[0].lower()}".encode('utf-8'), digest_size=8)
+        return digest.hexdigest()
+
+    def _evaluate_unique_articles(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        并发评估文章列表
+
+        AI评估是网络I/O密集型任务，使用线程池同时发起多个请求，
+        并发数由 `concurrency` 配置控制（默认8），以匹配提供商的速率限制。
+        `batch_size` 大于1时，每个请求合并评估多篇文章，减少请求次数和重复的提示词token。
+
+        Args:
+            articles: 文章列表
+
+        Returns:
+            List[Dict]: 与输入顺序一致的AI评估结果列表
+        """
+        if self.demo_mode:
+            # 演示模式是纯本地计算，直接根据文章字段评估，无需构建和解析提示词
+            return [
+                self._get_demo_evaluation(
+                    article.get('_search_text') or f"{article.get('title', '')} {article.get('abstract', '')}".lower()
+                )
+                for article in articles
+            ]
+
+        evaluations: List[Optional[Dict[str, Any]]] = [None] * len(articles)
+
+        # 预过滤：不含任何核心领域关键词的文章直接判定为不相关，不调用AI
+        candidates = []
+        for i, article in enumerate(articles):
+            if self.prefilter:
+                text = article.get('_search_text') or f"{article.get('title', '')} {article.get('abstract', '')}".lower()
+                matched = bin(_scan_keyword_mask(text) & _DEMO_AREA_MASK).count('1')
+                if matched < self.prefilter_threshold:
+                    evaluations[i] = {
+                        'relevant': False,
+                        'score': 0,
+                        'reason': f'prefilter: {matched} domain keyword area(s) matched',
+                        'application_areas': []
+                    }
+                    continue
+            candidates.append(i)
+
+        if len(candidates) < len(articles):
+            logger.info(f"⏭️ 预过滤跳过 {len(articles) - len(candidates)}/{len(articles)} 篇不含领域关键词的文章")
+
+        results = self._request_evaluations([articles[i] for i in candidates])
+        for i, result in zip(candidates, results):
+            evaluations[i] = result
+
+        return evaluations
+
+    def _request_evaluations(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        调用AI接口评估文章列表
+
+        Args:
+            articles: 文章列表
+
+        Returns:
+            List[Dict]: 与输入顺序一致的AI评估结果列表
+        """
+        if self.batch_size <= 1:
+            return self._run_concurrently(self._safe_evaluate_article, articles)
+
+        evaluations: List[Optional[Dict[str, Any]]] = [None] * len(articles)
+
+        # 已缓存的文章无需参与批量请求
+        pending = []
+        for i, article in enumerate(articles):
+            cache_key = self._cache_key(self._prepare_prompt(article))
+            cached = self.cache.get(cache_key) if cache_key is not None else None
+            if cached is not None:
+                evaluations[i] = cached
+            else:
+                pending.append(i)
+
+        chunks = [pending[i:i + self.batch_size] for i in range(0, len(pending), self.batch_size)]
+        chunk_results = self._run_concurrently(
+            lambda chunk: self._evaluate_batch([articles[i] for i in chunk]),
+            chunks
+        )
+        for chunk, results in zip(chunks, chunk_results):
+            for i, result in zip(chunk, results):
+                evaluations[i] = result
+
+        return evaluations
+
+    def _run_concurrently(self, func, items: List[Any]) -> List[Any]:
+        """
+        使用线程池并发执行任务
+
+        Args:
+            func: 处理单个元素的函数
+            items: 待处理元素列表
+
+        Returns:
+            List: 与输入顺序一致的结果列表
+        """
+        if self.concurrency <= 1 or len(items) <= 1:
+            return [func(item) for item in items]
+
+        with ThreadPoolExecutor(max_workers=min(self.concurrency, len(items))) as executor:
+            return list(executor.map(func, items))
+
+    def _evaluate_batch(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        在一次请求中评估多篇文章
+
+        批量请求失败或结果缺失的文章会退回逐篇评估。
+
+        Args:
+            articles: 文章列表
+
+        Returns:
+            List[Dict]: 与输入顺序一致的AI评估结果列表
+        """
+        results_by_id = {}
+        try:
+            # 每篇文章都需要独立的输出空间，生成时间也随文章数增加
+            response = self._request_completion(
+                self._prepare_batch_prompt(articles),
+                min(self.max_tokens * len(articles), self.batch_max_tokens),
+                self.request_timeout * len(articles)
+            )
+            results = response.get('results', []) if isinstance(response, dict) else response
+            for result in results:
+                if isinstance(result, dict) and 'id' in result:
+                    results_by_id[str(result.pop('id'))] = result
+        except Exception as e:
+            logger.warning(f"批量AI评估失败，改为逐篇评估: {e}")
+        else:
+            missing = sum(str(i) not in results_by_id for i in range(1, len(articles) + 1))
+            if missing:
+                logger.warning(f"批量AI评估缺少 {missing}/{len(articles)} 篇文章的结果，改为逐篇评估")
+
+        evaluations = []
+        for i, article in enumerate(articles, 1):
+            result = results_by_id.get(str(i))
+            if result is None:
+                evaluations.append(self._safe_evaluate_article(article))
+                continue
+
+            cache_key = self._cache_key(self._prepare_prompt(article))
+            if cache_key is not None:
+                self.cache.set(cache_key, result)
+            evaluations.append(result)
+
+        return evaluations
+
+    def _safe_evaluate_article(self, article: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        评估单篇文章，失败时返回默认保留的评估结果
+
+        Args:
+            article: 文章信息字典
+
+        Returns:
+            Dict: AI评估结果
+        """
+        try:
+            return self._evaluate_article(article)
+        except Exception as e:
+            logger.error(f"AI评估文章失败: {e}")
+            # 如果AI评估失败，默认保留文章
+            return {
+                'relevant': True,  # 默认保留
+                'score': 5,
+                'reason': f'AI评估失败: {str(e)}',
+                'tags': []
+            }
+
     def _evaluate_article(self, article: Dict[str, Any]) -> Dict[str, Any]:
         """
         使用AI评估单篇文章
@@ -130,18 +598,8 @@ class AIFilter:
         # 准备提示词
         prompt = self._prepare_prompt(article)
 
-        # 调用AI API
-        # 优先尝试使用特定提供商的实现（如果有特殊需求）
-        provider_lower = self.provider.lower()
-        specific_method = f"_call_{provider_lower}_api"
-        
-        if hasattr(self, specific_method):
-            # 使用特定提供商的实现
-            method = getattr(self, specific_method)
-            return method(prompt)
-        else:
-            # 使用通用API调用方法（适用于所有OpenAI兼容的API）
-            return self._call_generic_api(prompt)
+        # 调用AI API（提供商实现已在初始化时解析）
+        return self._call(prompt)
 
     def _prepare_prompt(self, article: Dict[str, Any]) -> str:
         """
@@ -159,25 +617,67 @@ class AIFilter:
         journal = article.get('journal', 'N/A')
         authors = ', '.join(article.get('authors', [])) if article.get('authors') else 'N/A'
 
-        # 根据语言设置调整提示词
-        prompt = self.prompt_template
+        # 格式化提示词
+        return self._prepared_template.format(
+            title=title,
+            abstract=abstract,
+            journal=journal,
+            authors=authors
+        )
+
+    def _localize_prompt_template(self, template: str) -> str:
+        """
+        根据语言设置调整提示词模板
+
+        Args:
+            template: 原始提示词模板
+
+        Returns:
+            str: 替换语言占位符后的提示词模板
+        """
         language_name = "English" if self.language == 'en' else "Chinese"
-        
+
         # 替换语言占位符
-        prompt = prompt.replace("{language}", language_name)
+        prompt = template.replace("{language}", language_name)
         if self.language == 'en':
             # 将提示词中的中文要求改为英文
             prompt = prompt.replace("Brief description in Chinese", "Brief description in English")
             prompt = prompt.replace("provide a brief description in Chinese", "provide a brief description in English")
             prompt = prompt.replace("description in Chinese", "description in English")
 
-        # 格式化提示词
-        return prompt.format(
-            title=title,
-            abstract=abstract,
-            journal=journal,
-            authors=authors
-        )
+        return prompt
+
+    def _prepare_batch_prompt(self, articles: List[Dict[str, Any]]) -> str:
+        """
+        准备批量评估的AI提示词
+
+        不变的评估说明在前，文章数据在后，便于提供商缓存提示词前缀。
+
+        Args:
+            articles: 文章列表
+
+        Returns:
+            str: 格式化的提示词
+        """
+        instructions = self._prepare_prompt({
+            'title': _BATCH_PLACEHOLDER,
+            'abstract': _BATCH_PLACEHOLDER,
+            'journal': _BATCH_PLACEHOLDER,
+            'authors': [_BATCH_PLACEHOLDER]
+        })
+
+        payload = [
+            {
+                'id': i,
+                'title': article.get('title', 'N/A'),
+                'abstract': article.get('abstract', 'N/A'),
+                'journal': article.get('journal', 'N/A'),
+                'authors': ', '.join(article.get('authors', [])) if article.get('authors') else 'N/A'
+            }
+            for i, article in enumerate(articles, 1)
+        ]
+
+        return instructions + _BATCH_INSTRUCTIONS + json.dumps(payload, ensure_ascii=False)
 
     def _call_generic_api(self, prompt: str) -> Dict[str, Any]:
         """
@@ -196,12 +696,45 @@ class AIFilter:
             # 演示模式：返回模拟结果
             return self._get_demo_response(prompt)
 
-        url = f"{self.base_url}/chat/completions"
+        # 相同模型参数和提示词的结果直接从缓存读取
+        cache_key = self._cache_key(prompt)
+        if cache_key is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
 
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
+        parsed = self._request_completion(prompt, self.max_tokens)
+        if cache_key is not None:
+            self.cache.set(cache_key, parsed)
+        return parsed
+
+    def _cache_key(self, prompt: str) -> Optional[str]:
+        """
+        计算提示词对应的缓存键
+
+        Args:
+            prompt: 提示词
+
+        Returns:
+            Optional[str]: 缓存键，未启用缓存时返回None
+        """
+        if self.cache is None:
+            return None
+        return LLMCache.make_key(self.model_name, prompt, self.temperature, self.max_tokens)
+
+    def _request_completion(self, prompt: str, max_tokens: int, timeout: Optional[float] = None) -> Any:
+        """
+        向OpenAI兼容的 /chat/completions 端点发送请求并解析JSON内容
+
+        Args:
+            prompt: 提示词
+            max_tokens: 最大生成token数
+            timeout: 请求超时时间（秒），默认使用 request_timeout
+
+        Returns:
+            Any: 解析后的JSON响应内容
+        """
+        url = f"{self.base_url}/chat/completions"
 
         data = {
             "model": self.model_name,
@@ -212,37 +745,26 @@ class AIFilter:
                 }
             ],
             "temperature": self.temperature,
-            "max_tokens": self.max_tokens,
+            "max_tokens": max_tokens,
             "response_format": {"type": "json_object"}
         }
 
         try:
-            response = requests.post(url, headers=headers, json=data, timeout=30)
+            # Content-Type 已在会话头中设置
+            response = self._session.post(url, data=_json_dumps(data), timeout=timeout or self.request_timeout)
             response.raise_for_status()
 
-            result = response.json()
+            result = _json_loads(response.content)
             content = result['choices'][0]['message']['content']
 
-            # 解析JSON响应
-            return json.loads(content)
+            # 解析JSON响应（orjson.JSONDecodeError 是 json.JSONDecodeError 的子类）
+            return _json_loads(content)
 
         except requests.exceptions.RequestException as e:
             raise Exception(f"{self.provider} API请求失败: {e}")
         except json.JSONDecodeError as e:
             raise Exception(f"解析AI响应失败: {e}")
 
-    def _call_deepseek_api(self, prompt: str) -> Dict[str, Any]:
-        """
-        调用DeepSeek API（使用通用方法）
-
-        Args:
-            prompt: 提示词
-
-        Returns:
-            Dict: API响应结果
-        """
-        return self._call_generic_api(prompt)
-
     def _get_demo_response(self, prompt: str) -> Dict[str, Any]:
         """
         获取演示模式的模拟响应
@@ -269,138 +791,38 @@ class AIFilter:
             abstract = prompt[abstract_start:abstract_end].lower()
 
         # 模拟AI的完整评估过程
-        full_text = (title + " " + abstract).lower()
-        
+        return self._get_demo_evaluation((title + " " + abstract).lower())
+
+    def _get_demo_evaluation(self, full_text: str) -> Dict[str, Any]:
+        """
+        根据文章文本生成演示模式的评估结果
+
+        Args:
+            full_text: 小写的标题和摘要文本
+
+        Returns:
+            Dict: 模拟的AI评估结果
+        """
+        mask = _scan_keyword_mask(full_text)
+
         # 检查是否包含核心应用领域关键词
         application_areas = []
         descriptions = []
-        
-        # phenotype from genotype
-        if any(word in full_text for word in ['phenotype', 'genotype', 'phenotype from genotype']):
-            application_areas.append("phenotype from genotype")
-            descriptions.append("predicts phenotypes from genotype data")
-        
-        # life cycle simulation
-        if any(word in full_text for word in ['life cycle', 'lifecycle', 'simulation']):
-            application_areas.append("life cycle simulation")
-            descriptions.append("simulates life cycle processes")
-        
-        # cell cycle regulator
-        if any(word in full_text for word in ['cell cycle', 'cell cycle regulator']):
-            application_areas.append("cell cycle regulator")
-            descriptions.append("studies cell cycle regulation")
-        
-        # single-cell multi-omics
-        if any(word in full_text for word in ['single-cell', 'single cell', 'multi-omics', 'multiomics']):
-            application_areas.append("single-cell multi-omics")
-            descriptions.append("integrates single-cell multi-omics data")
-        
-        # scATAC-seq
-        if 'scatac-seq' in full_text or 'scatac' in full_text:
-            application_areas.append("scATAC-seq")
-            descriptions.append("analyzes scATAC-seq data")
-        
-        # scRNA-seq
-        if 'scrna-seq' in full_text or 'scrna' in full_text:
-            application_areas.append("scRNA-seq")
-            descriptions.append("analyzes scRNA-seq data")
-        
-        # chromatin accessibility
-        if any(word in full_text for word in ['chromatin accessibility', 'chromatin access']):
-            application_areas.append("chromatin accessibility")
-            descriptions.append("studies chromatin accessibility")
-        
-        # gene regulatory network
-        if any(word in full_text for word in ['gene regulatory', 'regulatory network']):
-            application_areas.append("gene regulatory network")
-            descriptions.append("models gene regulatory networks")
-        
-        # enhancer-gene linking
-        if any(word in full_text for word in ['enhancer', 'enhancer-gene', 'enhancer gene']):
-            application_areas.append("enhancer-gene linking")
-            descriptions.append("links enhancers to genes")
-        
-        # chromatin potential
-        if 'chromatin potential' in full_text:
-            application_areas.append("chromatin potential")
-            descriptions.append("analyzes chromatin potential")
-        
-        # GWAS variant enrichment
-        if any(word in full_text for word in ['gwas', 'variant enrichment']):
-            application_areas.append("GWAS variant enrichment")
-            descriptions.append("performs GWAS variant enrichment")
-        
-        # eQTL
-        if 'eqtl' in full_text:
-            application_areas.append("eQTL")
-            descriptions.append("conducts eQTL analysis")
-        
-        # metabolomics analysis
-        if any(word in full_text for word in ['metabolomics', 'metabolome', 'metabolic profiling', 'metabolite']):
-            application_areas.append("metabolomics analysis")
-            descriptions.append("analyzes metabolomics data")
-        
-        # proteomics analysis
-        if any(word in full_text for word in ['proteomics', 'proteome', 'protein identification', 'protein quantification']):
-            application_areas.append("proteomics analysis")
-            descriptions.append("analyzes proteomics data")
-        
-        # computational metabolomics
-        if any(word in full_text for word in ['computational metabolomics', 'metabolomics algorithm', 'metabolomics method']):
-            application_areas.append("computational metabolomics")
-            descriptions.append("develops computational methods for metabolomics")
-        
-        # computational proteomics
-        if any(word in full_text for word in ['computational proteomics', 'proteomics algorithm', 'proteomics method']):
-            application_areas.append("computational proteomics")
-            descriptions.append("develops computational methods for proteomics")
-        
-        # virtual cell
-        if any(word in full_text for word in ['virtual cell', 'cell simulation', 'cellular modeling', 'in silico cell']):
-            application_areas.append("virtual cell")
-            descriptions.append("creates virtual cell models and simulations")
-        
-        # aging
-        if any(word in full_text for word in ['aging', 'ageing', 'senescence', 'longevity', 'aging biology']):
-            application_areas.append("aging")
-            descriptions.append("studies aging processes and mechanisms")
-        
-        # foundation model
-        if any(word in full_text for word in ['foundation model', 'foundational model', 'multimodal foundation model', 'biology foundation model', 'omics foundation model']):
-            application_areas.append("foundation model")
-            descriptions.append("develops foundation models for biological data")
+        if mask:
+            for bit, (area, description, _) in enumerate(_DEMO_AREAS):
+                if mask >> bit & 1:
+                    application_areas.append(area)
+                    descriptions.append(description)
+
         if application_areas:
             relevant = True
             score = min(10, 6 + len(application_areas) * 1)  # 基础分6，每匹配一个领域加1分
             
             # 根据语言设置生成描述
             if self.language == 'zh':
-                # 中文描述
-                zh_descriptions = {
-                    "predicts phenotypes from genotype data": "预测基因型到表型",
-                    "simulates life cycle processes": "模拟生命周期过程",
-                    "studies cell cycle regulation": "研究细胞周期调控",
-                    "integrates single-cell multi-omics data": "整合单细胞多组学数据",
-                    "analyzes scATAC-seq data": "分析scATAC-seq数据",
-                    "analyzes scRNA-seq data": "分析scRNA-seq数据",
-                    "studies chromatin accessibility": "研究染色质可及性",
-                    "models gene regulatory networks": "建模基因调控网络",
-                    "links enhancers to genes": "连接增强子到基因",
-                    "analyzes chromatin potential": "分析染色质潜力",
-                    "performs GWAS variant enrichment": "进行GWAS变异富集分析",
-                    "conducts eQTL analysis": "进行eQTL分析",
-                    "analyzes metabolomics data": "分析代谢组学数据",
-                    "analyzes proteomics data": "分析蛋白质组学数据",
-                    "develops computational methods for metabolomics": "开发代谢组学计算方法",
-                    "develops computational methods for proteomics": "开发蛋白质组学计算方法",
-                    "creates virtual cell models and simulations": "创建虚拟细胞模型和模拟",
-                    "studies aging processes and mechanisms": "研究衰老过程和机制",
-                    "develops foundation models for biological data": "开发生物数据基础模型"
-                }
-                zh_desc = zh_descriptions.get(descriptions[0], descriptions[0])
-                description = f"文章{zh_desc}"
+                description = f"文章{_ZH_DESCRIPTIONS[descriptions[0]]}"
                 if len(descriptions) > 1:
-                    zh_others = [zh_descriptions.get(d, d) for d in descriptions[1:]]
+                    zh_others = [_ZH_DESCRIPTIONS[d] for d in descriptions[1:]]
                     description += f"和{', '.join(zh_others)}"
             else:
                 # 英文描述
@@ -418,22 +840,10 @@ class AIFilter:
 
         # 确定主题分类
         topic = "other"
-        if any(word in full_text for word in ['single-cell', 'single cell', 'scrna', 'scatac']):
-            topic = "single-cell"
-        elif any(word in full_text for word in ['genomics', 'genome', 'genomic', 'dna', 'rna']):
-            topic = "genomics"
-        elif any(word in full_text for word in ['proteomics', 'proteome', 'protein']):
-            topic = "proteomics"
-        elif any(word in full_text for word in ['metabolomics', 'metabolome', 'metabolic']):
-            topic = "metabolomics"
-        elif any(word in full_text for word in ['network', 'regulatory network', 'gene regulatory']):
-            topic = "network"
-        elif any(word in full_text for word in ['simulation', 'modeling', 'virtual cell']):
-            topic = "simulation"
-        elif any(word in full_text for word in ['foundation model', 'foundational model', 'llm', 'language model']):
-            topic = "foundation_model"
-        elif any(word in full_text for word in ['aging', 'ageing', 'senescence']):
-            topic = "aging"
+        topic_mask = mask >> _DEMO_TOPIC_SHIFT
+        if topic_mask:
+            # 最低位对应优先级最高的主题
+            topic = _DEMO_TOPICS[(topic_mask & -topic_mask).bit_length() - 1][0]
         
         return {
             "relevant": relevant,
@@ -443,29 +853,12 @@ class AIFilter:
             "topic": topic
         }
 
-    def _call_kimi_api(self, prompt: str) -> Dict[str, Any]:
-        """
-        调用Kimi API (Moonshot)（使用通用方法）
-
-        Args:
-            prompt: 提示词
-
-        Returns:
-            Dict: API响应结果
-        """
-        return self._call_generic_api(prompt)
-
-    def _call_openai_api(self, prompt: str) -> Dict[str, Any]:
-        """
-        调用OpenAI API（使用通用方法）
-
-        Args:
-            prompt: 提示词
-
-        Returns:
-            Dict: API响应结果
-        """
-        return self._call_generic_api(prompt)
+    # 提供商到API调用方法的映射，目前的提供商均兼容OpenAI接口
+    _PROVIDER_DISPATCH = {
+        'deepseek': _call_generic_api,
+        'kimi': _call_generic_api,
+        'openai': _call_generic_api,
+    }
 
 
 def load_ai_filter(config: Dict[str, Any]) -> AIFilter:
@@ -496,6 +889,8 @@ def filter_articles_with_ai(articles: List[Dict[str, Any]], config: Dict[str, An
     """
     使用AI过滤文章的便捷函数
 
+    AI评估结果会原地写入输入文章的 `ai_evaluation` 字段。
+
     Args:
         articles: 文章列表
         config: 配置字典
@@ -0,0 +1,77 @@
+# author_match.py
+"""
+作者名字匹配模块
+将不同格式的作者名字标准化，并判断两个名字是否指向同一个人
+"""
+
+import functools
+
+
+@functools.lru_cache(maxsize=4096)
+def normalize_author(author_name: str) -> str:
+    """
+    标准化作者名字，用于匹配
+
+    将不同格式的名字转换为统一的 "名 姓" 格式，忽略中间名和缩写：
+    - "Fabian Theis" -> "fabian theis"
+    - "Theis, Fabian" -> "fabian theis"
+    - "Theis, Fabian J." -> "fabian theis"
+    - "Fabian J. Theis" -> "fabian theis"
+
+    同一作者会出现在多篇文章中，结果按名字缓存
+
+    Args:
+        author_name: 作者名字
+
+    Returns:
+        str: 标准化后的名字，名和姓之间以单个空格分隔
+    """
+    if not author_name:
+        return ""
+
+    normalized = author_name.lower()
+
+    # 处理 "LastName, FirstName" 格式：交换顺序，第二个逗号之后的内容忽略
+    if ',' in normalized:
+        last_name, _, rest = normalized.partition(',')
+        normalized = f"{rest.partition(',')[0]} {last_name}"
+
+    # 只保留第一个词（名）和最后一个词（姓）
+    words = normalized.split()
+    if len(words) >= 2:
+        return f"{words[0]} {words[-1]}"
+    return words[0] if words else ""
+
+
+def author_names_match(author1: str, author2: str) -> bool:
+    """
+    判断两个作者名字是否指向同一个人
+
+    支持多种格式匹配：
+    - "Fabian Theis" 匹配 "Fabian J. Theis"
+    - "Theis, Fabian" 匹配 "Fabian Theis"
+    - "Fabian Theis" 匹配 "Theis, Fabian J."
+
+    Args:
+        author1: 作者名字
+        author2: 作者名字
+
+    Returns:
+        bool: 是否匹配
+    """
+    if not author1 or not author2:
+        return False
+
+    norm1 = normalize_author(author1)
+    norm2 = normalize_author(author2)
+
+    # 完全匹配（标准化后名和姓都相同）
+    if norm1 == norm2:
+        return True
+    if not norm1 or not norm2:
+        return False
+
+    # 标准化后的名字有包含关系且姓相同，例如只有姓的 "theis" 与 "fabian theis"
+    if norm1 not in norm2 and norm2 not in norm1:
+        return False
+    return norm1.rpartition(' ')[2] == norm2.rpartition(' ')[2]
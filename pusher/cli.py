@@ -5,7 +5,9 @@
 """
 
 import argparse
+import json
 import sys
+import traceback
 from pathlib import Path
 
 from .search import ArticleSearcher
@@ -29,6 +31,12 @@ def main():
 
   # 推送已保存的结果
   bioinfo-pusher --push-saved results.json
+
+  # 搜索、过滤和推送以流水线方式并行进行
+  bioinfo-pusher --pipeline
+
+  # 忽略PubMed缓存和HTTP缓存，重新获取所有文章
+  bioinfo-pusher --refresh
         """
     )
 
@@ -65,6 +73,18 @@ def main():
         help="推送已保存的结果文件"
     )
 
+    parser.add_argument(
+        "--pipeline",
+        action="store_true",
+        help="以流水线方式运行：边搜索边过滤边推送"
+    )
+
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="忽略PubMed缓存和HTTP缓存，重新检索并获取所有文章"
+    )
+
     parser.add_argument(
         "--output",
         type=str,
@@ -81,7 +101,7 @@ def main():
             sys.exit(1)
 
         # 初始化搜索器
-        searcher = ArticleSearcher(args.config, args.secrets)
+        searcher = ArticleSearcher(args.config, args.secrets, refresh=args.refresh)
 
         if args.push_saved:
             # 推送已保存的结果
@@ -89,7 +109,6 @@ def main():
                 print(f"❌ 结果文件不存在: {args.push_saved}")
                 sys.exit(1)
 
-            import json
             with open(args.push_saved, 'r', encoding='utf-8') as f:
                 saved_results = json.load(f)
 
@@ -106,6 +125,17 @@ def main():
                 print("❌ 推送失败")
                 sys.exit(1)
 
+        elif args.pipeline:
+            # 流水线工作流程
+            print(f"🚀 开始以流水线方式处理最近 {args.days} 天的生物文章...")
+
+            filtered_results = searcher.run_pipeline(days=args.days, push=not args.no_push)
+            filtered_count = sum(len(articles) for articles in filtered_results.values())
+            print(f"🤖 搜索和AI过滤完成，剩余 {filtered_count} 篇文章")
+
+            output_file = searcher.save_results(filtered_results, args.days)
+            print(f"🎉 工作流程完成！结果已保存到: {output_file}")
+
         else:
             # 完整工作流程
             print(f"🚀 开始搜索最近 {args.days} 天的生物文章...")
@@ -139,7 +169,6 @@ def main():
         sys.exit(1)
     except Exception as e:
         print(f"❌ 发生错误: {e}")
-        import traceback
         traceback.print_exc()
         sys.exit(1)
 
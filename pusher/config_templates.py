@@ -7,6 +7,12 @@ import yaml
 from pathlib import Path
 from typing import Optional
 
+# 优先使用基于libyaml的C实现，未安装libyaml时退回纯Python实现
+try:
+    from yaml import CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeDumper as _Dumper
+
 
 def create_config_template(output_path: Optional[str] = None) -> str:
     """
@@ -169,7 +175,7 @@ Return JSON only:
     # 写入文件
     output_file = Path(output_path)
     with open(output_file, 'w', encoding='utf-8') as f:
-        yaml.dump(config, f, allow_unicode=True, default_flow_style=False, sort_keys=False)
+        yaml.dump(config, f, Dumper=_Dumper, allow_unicode=True, default_flow_style=False, sort_keys=False)
     
     return str(output_file.absolute())
 
@@ -210,7 +216,7 @@ def create_secrets_template(output_path: Optional[str] = None) -> str:
     # 写入文件
     output_file = Path(output_path)
     with open(output_file, 'w', encoding='utf-8') as f:
-        yaml.dump(config, f, allow_unicode=True, default_flow_style=False, sort_keys=False)
+        yaml.dump(config, f, Dumper=_Dumper, allow_unicode=True, default_flow_style=False, sort_keys=False)
     
     return str(output_file.absolute())
 
@@ -4,18 +4,365 @@
 将文章搜索结果推送到飞书机器人
 """
 
+import atexit
+import hashlib
 import json
 import logging
-import requests
-import yaml
-from typing import Dict, List, Any, Optional
+import random
+import re
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
+from itertools import chain, islice
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .rate_limit import TokenBucket
+
+# orjson为可选依赖，未安装时使用标准库json
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+
+def _dumps(obj: Any) -> bytes:
+    """序列化为UTF-8编码的JSON字节串"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    # 不转义中文和emoji、不加多余空格，减小消息体积
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+# 飞书卡片消息的大小上限（字节）
+_MAX_CARD_BYTES = 30_000
+
+# 单张卡片的最大元素数
+_MAX_CARD_ELEMENTS = 50
+
+# 合并多个主题时为标题、底部信息和消息外层结构预留的字节数
+_CARD_OVERHEAD_BYTES = 1024
+
+# 配置模板中的webhook占位地址，视为未配置
+_PLACEHOLDER_WEBHOOKS = frozenset(
+    {
+        "https://open.feishu.cn/open-apis/bot/v2/hook/your-webhook-id",
+        "YOUR_FEISHU_WEBHOOK_URL_HERE",
+    }
+)
+
+# 摘要截断后追加的省略号
+_ELLIPSIS = "..."
+
+# abstract_max_length 设置为0时使用的摘要截断长度
+_DEFAULT_ABSTRACT_MAX_LENGTH = 500
+
+# 是否已提示过 abstract_max_length 配置为0；流水线每次推送都会创建推送器，只提示一次
+_abstract_length_warned = False
+
+# 缺失字段时使用的只读空字典
+_EMPTY: Dict[str, Any] = {}
+
+# 推送消息中的固定文本，按语言区分；未知语言使用中文
+_LABELS = {
+    "en": {
+        "journal": "📰 **Journal**: ",
+        "authors": "👥 **Authors**: ",
+        "ai_evaluation": "🤖 **AI Evaluation**: ",
+        "score": "⭐ Score: ",
+        "areas": "🔬 Areas: ",
+        "summary": "💡 AI Summary: ",
+        "abstract": "📄 **Abstract**: ",
+        "link": "🔗 [View Article]({link})",
+        "no_articles": "📭 No articles found matching the criteria",
+        "footer": "🤖 *AI Smart Filtering | Biological Article Push*",
+        "header_prefix": "**📰 Biological Article Push**\n\n**📊 Search Statistics**",
+        "journal_count": "- Journals searched: ",
+        "total_articles": "- Candidate articles: ",
+        "filtered_count": "- After AI filtering: ",
+        "journal_suffix": "",
+        "count_suffix": "",
+        "generated_at": "- Generated at: ",
+        "part": "- Message: ",
+        "topic_section": "**🏷️ {topic_name}** ({topic_count} articles)",
+        "topic_batch": " · Batch {batch_num}/{total_batches}",
+    },
+    "zh": {
+        "journal": "📰 **期刊**: ",
+        "authors": "👥 **作者**: ",
+        "ai_evaluation": "🤖 **AI评估**: ",
+        "score": "⭐ 评分: ",
+        "areas": "🔬 领域: ",
+        "summary": "💡 AI总结: ",
+        "abstract": "📄 **摘要**: ",
+        "link": "🔗 [查看原文]({link})",
+        "no_articles": "📭 本次搜索未找到符合条件的文章",
+        "footer": "🤖 *AI智能筛选 | 生物文章推送*",
+        "header_prefix": "**📰 生物文章推送**\n\n**📊 搜索统计**",
+        "journal_count": "- 搜索期刊: ",
+        "journal_suffix": " 个",
+        "total_articles": "- 候选文章: ",
+        "filtered_count": "- AI筛选后: ",
+        "count_suffix": " 篇",
+        "generated_at": "- 生成时间: ",
+        "part": "- 消息: ",
+        "topic_section": "**🏷️ {topic_name}** ({topic_count} 篇)",
+        "topic_batch": " · 批次 {batch_num}/{total_batches}",
+    },
+}
+
+# 主题显示名称，按语言区分；非中文时使用英文
+_TOPIC_NAMES = {
+    "zh": {
+        "single-cell": "单细胞分析",
+        "genomics": "基因组学",
+        "proteomics": "蛋白质组学",
+        "metabolomics": "代谢组学",
+        "network": "网络分析",
+        "simulation": "模拟建模",
+        "foundation_model": "基础模型",
+        "aging": "衰老研究",
+        "other": "其他",
+    },
+    "en": {
+        "single-cell": "Single-cell Analysis",
+        "genomics": "Genomics",
+        "proteomics": "Proteomics",
+        "metabolomics": "Metabolomics",
+        "network": "Network Analysis",
+        "simulation": "Simulation",
+        "foundation_model": "Foundation Model",
+        "aging": "Aging",
+        "other": "Other",
+    },
+}
+
+# 卡片分隔线元素，所有卡片共用同一个对象
+_HR = {"tag": "hr"}
+
+
+def _lark_div(content: str) -> Dict[str, Any]:
+    """
+    构建Markdown文本卡片元素
+
+    Args:
+        content: lark_md格式的文本内容
+
+    Returns:
+        Dict[str, Any]: 卡片元素
+    """
+    return {"tag": "div", "text": {"tag": "lark_md", "content": content}}
+
+
+# 卡片配置，由本模块构建的卡片共用
+_CARD_CONFIG = {"wide_screen_mode": True}
+
+# 各语言的底部信息元素
+_FOOTER_DIVS = {language: _lark_div(labels["footer"]) for language, labels in _LABELS.items()}
+
+# 同时推送到多个webhook时的最大并发数
+_MAX_PUSH_WORKERS = 8
+
+# 启用 concurrent_cards 时并发发送的最大主题消息数
+_MAX_TOPIC_WORKERS = 4
+
+# 最近成功推送的卡片摘要及推送时间，用于跳过重复推送；按推送时间排序，写入时清理过期记录。
+# 记录只保存在当前进程中，定时任务的每次运行都是新进程，互不影响
+_recent_pushes: "OrderedDict[bytes, float]" = OrderedDict()
+_recent_pushes_lock = threading.Lock()
+
+# 最多记录的推送摘要数，长时间运行的进程中不会无限增长
+_MAX_RECENT_PUSHES = 1024
+
+
+def _remember_push(digest: bytes, ttl: float):
+    """
+    记录一次成功的推送，并清理超过去重时间窗口的记录
+
+    Args:
+        digest: 卡片内容摘要
+        ttl: 去重时间窗口（秒）
+    """
+    now = time.monotonic()
+    with _recent_pushes_lock:
+        _recent_pushes[digest] = now
+        _recent_pushes.move_to_end(digest)
+        while _recent_pushes:
+            oldest, sent_at = next(iter(_recent_pushes.items()))
+            if now - sent_at < ttl and len(_recent_pushes) <= _MAX_RECENT_PUSHES:
+                break
+            del _recent_pushes[oldest]
+
+
+# SimHash指纹分为4段，汉明距离不超过3时至少有一段完全相同
+_SIMHASH_BANDS = 4
+_SIMHASH_BAND_BITS = 16
+_SIMHASH_BAND_MASK = (1 << _SIMHASH_BAND_BITS) - 1
+_SIMHASH_MAX_DISTANCE = 3
+_WORD_RE = re.compile(r"\w+")
+
+
+def _simhash(text: str) -> int:
+    """
+    计算文本的64位SimHash指纹
+
+    Args:
+        text: 文本内容
+
+    Returns:
+        int: 64位指纹，文本过短时返回0
+    """
+    # 以规范化文本的4字符片段为特征，对单词的细微差异（如单复数）更稳定
+    normalized = " ".join(_WORD_RE.findall(text.lower()))
+    weights = [0] * 64
+    for token in {normalized[i : i + 4] for i in range(len(normalized) - 3)}:
+        h = int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "big")
+        for bit in range(64):
+            weights[bit] += 1 if h >> bit & 1 else -1
+
+    fingerprint = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+# 飞书表示请求被限流的错误码
+_RATE_LIMIT_CODES = frozenset({9499, 11232})
+
+# 被限流时的最大重试次数
+_RATE_LIMIT_RETRIES = 3
+
+# 各webhook的令牌桶，按webhook地址索引
+_buckets: Dict[str, TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def _retry_delay(response: requests.Response, attempt: int) -> float:
+    """
+    计算限流后的重试等待时间
+
+    Args:
+        response: 被限流的响应
+        attempt: 已重试次数
+
+    Returns:
+        float: 等待秒数，优先使用 Retry-After 响应头，否则指数退避并加入随机抖动
+    """
+    retry_after = response.headers.get("Retry-After")
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+    return min(30.0, 2.0**attempt) + random.uniform(0, 0.5)
+
+
+def _get_bucket(webhook_url: str, rate_limit_per_min: float) -> TokenBucket:
+    """
+    获取webhook对应的令牌桶，同一webhook在进程内共享限速
+
+    Args:
+        webhook_url: 飞书机器人webhook地址
+        rate_limit_per_min: 每分钟最多推送的消息数
+
+    Returns:
+        TokenBucket: 令牌桶
+    """
+    with _buckets_lock:
+        bucket = _buckets.get(webhook_url)
+        if bucket is None:
+            bucket = _buckets[webhook_url] = TokenBucket(rate=rate_limit_per_min / 60, capacity=10)
+        return bucket
+
+
+# 模块级共享的HTTP会话，首次推送时创建
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def _get_session() -> requests.Session:
+    """
+    获取共享的HTTP会话
+
+    Returns:
+        requests.Session: 带连接池和重试配置的会话
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            session.headers.update({"Content-Type": "application/json", "Connection": "keep-alive"})
+            session.mount(
+                "https://",
+                HTTPAdapter(
+                    pool_connections=1,
+                    pool_maxsize=_MAX_PUSH_WORKERS,
+                    # webhook推送为POST请求，需显式允许重试；限流（429）由 _post 按 Retry-After 处理
+                    max_retries=Retry(
+                        total=3,
+                        backoff_factor=0.3,
+                        status_forcelist=(500, 502, 503, 504),
+                        allowed_methods=frozenset(["POST"]),
+                    ),
+                ),
+            )
+            _session = session
+        return _session
+
+
+def close_session():
+    """关闭共享的HTTP会话，之后的推送会重新创建会话"""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+# 进程退出时释放连接池
+atexit.register(close_session)
+
+
 class FeishuPusher:
     """飞书推送器类"""
 
+    # 固定实例属性，新增属性时需同步添加
+    __slots__ = (
+        "config",
+        "webhook_url",
+        "webhook_urls",
+        "max_articles_per_push",
+        "include_abstract",
+        "abstract_max_length",
+        "max_authors",
+        "include_ai_evaluation",
+        "template",
+        "language",
+        "enabled",
+        "_dedupe_ttl",
+        "_rate_limit_per_min",
+        "_fuzzy_dedup",
+        "_concurrent_cards",
+        "_labels",
+        "_footer_div",
+        "_topic_names",
+        "_session",
+        "_buffer",
+        "_buffer_bytes",
+        "_buffer_max_bytes",
+        "_md_cache",
+        "_render_article",
+    )
+
     def __init__(self, config: Dict[str, Any]):
         """
         初始化飞书推送器
@@ -24,24 +371,137 @@ class FeishuPusher:
             config: 飞书配置字典
         """
         self.config = config
-        self.webhook_url = config['webhook_url']
-        self.max_articles_per_push = config['push_config']['max_articles_per_push']
-        self.include_abstract = config['push_config']['include_abstract']
-        self.abstract_max_length = config['push_config']['abstract_max_length']
-        self.include_ai_evaluation = config['push_config']['include_ai_evaluation']
-        self.template = config['push_config']['template']
-        self.language = config['push_config'].get('language', 'zh')  # 默认中文
-
-        # 验证配置
-        if not self.webhook_url or self.webhook_url == "https://open.feishu.cn/open-apis/bot/v2/hook/your-webhook-id":
+        self.webhook_url = config.get("webhook_url")
+        # 同一张卡片可同时推送到多个webhook（多个群聊）
+        self.webhook_urls = [
+            url
+            for url in dict.fromkeys([self.webhook_url, *(config.get("webhook_urls") or [])])
+            if url and url not in _PLACEHOLDER_WEBHOOKS
+        ]
+        self.max_articles_per_push = config["push_config"]["max_articles_per_push"]
+        self.include_abstract = config["push_config"]["include_abstract"]
+        # 摘要最大长度，负数（如-1）表示不截断
+        self.abstract_max_length = config["push_config"]["abstract_max_length"]
+        if self.abstract_max_length == 0:
+            global _abstract_length_warned
+            if not _abstract_length_warned:
+                logger.warning(
+                    "⚠️ abstract_max_length 为0，摘要将截断为 %d 字符", _DEFAULT_ABSTRACT_MAX_LENGTH
+                )
+                _abstract_length_warned = True
+            self.abstract_max_length = _DEFAULT_ABSTRACT_MAX_LENGTH
+        self.max_authors = config["push_config"].get(
+            "max_authors", 5
+        )  # 显示的最大作者数，不大于0时显示全部
+        self.include_ai_evaluation = config["push_config"]["include_ai_evaluation"]
+        self.template = config["push_config"]["template"]
+        self._dedupe_ttl = config["push_config"].get(
+            "dedupe_ttl_seconds", 0
+        )  # 重复推送判定窗口（秒），0表示不去重
+        self._rate_limit_per_min = config["push_config"].get(
+            "rate_limit_per_min", 100
+        )  # 每个webhook每分钟最多推送数
+        self._fuzzy_dedup = config["push_config"].get("fuzzy_dedup", False)  # 是否按标题相似度去重
+        # 是否并发发送多条主题消息；并发时消息到达飞书的顺序可能与编号不一致
+        self._concurrent_cards = config["push_config"].get("concurrent_cards", False)
+        self.language = config["push_config"].get("language", "zh")  # 默认中文
+        self._labels = _LABELS.get(self.language, _LABELS["zh"])
+        self._footer_div = _FOOTER_DIVS.get(self.language, _FOOTER_DIVS["zh"])
+        self._topic_names = _TOPIC_NAMES["zh" if self.language == "zh" else "en"]
+
+        # 验证配置，推送未启用或webhook未配置时 enabled 为False
+        if not self.webhook_urls:
             logger.warning("⚠️ 飞书webhook URL未配置，将跳过推送")
             self.enabled = False
         else:
-            self.enabled = True
+            self.enabled = bool(config.get("enabled", False))
+
+        # 所有推送器共享同一个HTTP会话，多次推送时避免重复进行TCP和TLS握手
+        self._session = _get_session()
 
-    def push_articles(self, all_results: Dict[str, List[Dict[str, Any]]],
-                     filtered_articles: List[Dict[str, Any]],
-                     search_days: int) -> bool:
+        # 合并推送缓冲区，仅在 buffered_push() 上下文中不为None
+        self._buffer: Optional[List[Dict[str, Any]]] = None
+        self._buffer_bytes = 0
+        self._buffer_max_bytes = _MAX_CARD_BYTES
+
+        # 文章Markdown缓存: (id(article), index) -> (article, content)
+        self._md_cache: Dict[tuple, tuple] = {}
+        self._render_article = self._make_formatter()
+
+    @contextmanager
+    def buffered_push(self, max_bytes: int = _MAX_CARD_BYTES):
+        """
+        合并推送上下文
+
+        上下文中发送的卡片不会立即推送，而是将其元素缓存起来，退出时合并为一张卡片发送；
+        缓存即将超过飞书卡片大小限制时提前发送已缓存的内容。
+
+        Args:
+            max_bytes: 合并后单张卡片元素的最大字节数
+
+        Yields:
+            FeishuPusher: 推送器自身
+        """
+        self._buffer = []
+        self._buffer_bytes = 0
+        self._buffer_max_bytes = max_bytes
+        try:
+            yield self
+        finally:
+            self._flush_buffer()
+            self._buffer = None
+
+    def _append_to_buffer(self, elements: List[Dict[str, Any]]) -> bool:
+        """
+        将卡片元素加入合并推送缓冲区
+
+        Args:
+            elements: 卡片元素列表
+
+        Returns:
+            bool: 提前发送（如有）是否成功
+        """
+        size = sum(len(_dumps(element)) for element in elements)
+
+        success = True
+        if self._buffer and (
+            self._buffer_bytes + size > self._buffer_max_bytes
+            or len(self._buffer) + 1 + len(elements) > _MAX_CARD_ELEMENTS
+        ):
+            success = self._flush_buffer()
+
+        if self._buffer:
+            # 不同卡片的内容之间添加分隔线
+            self._buffer.append(_HR)
+        self._buffer.extend(elements)
+        self._buffer_bytes += size
+        return success
+
+    def _flush_buffer(self) -> bool:
+        """
+        将缓冲区中的元素合并为一张卡片发送
+
+        Returns:
+            bool: 发送是否成功
+        """
+        if not self._buffer:
+            return True
+
+        elements, self._buffer = self._buffer, None
+        try:
+            return self._send_to_feishu(
+                {"msg_type": "interactive", "card": {"config": _CARD_CONFIG, "elements": elements}}
+            )
+        finally:
+            self._buffer = []
+            self._buffer_bytes = 0
+
+    def push_articles(
+        self,
+        all_results: Dict[str, List[Dict[str, Any]]],
+        filtered_articles: List[Dict[str, Any]],
+        search_days: int,
+    ) -> bool:
         """
         推送文章到飞书（按主题分批次推送）
 
@@ -53,108 +513,79 @@ class FeishuPusher:
         Returns:
             bool: 推送是否成功
         """
-        if not self.config.get('enabled', False) or not self.enabled:
+        if not self.enabled:
             logger.info("飞书推送已禁用")
             return True
 
         try:
+            filtered_articles = self._dedup_articles(filtered_articles)
+
             # 检查是否启用主题分组推送
-            group_by_topic = self.config.get('push_config', {}).get('group_by_topic', True)
-            
+            group_by_topic = self.config.get("push_config", {}).get("group_by_topic", True)
+
             if group_by_topic:
                 # 按主题分组并分批推送
                 return self._push_by_topics(all_results, filtered_articles, search_days)
             else:
                 # 原有推送方式（单次推送）
-                card_message = self._prepare_message(all_results, filtered_articles, search_days)
+                card_message = self._build_card_message(all_results, filtered_articles, search_days)
                 return self._send_to_feishu(card_message)
 
         except Exception as e:
-            logger.error(f"飞书推送失败: {e}")
+            logger.error("飞书推送失败: %s", e)
             return False
 
-    def _format_single_article(self, article: Dict[str, Any], index: int) -> str:
+    def _dedup_articles(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
-        格式化单篇文章为推送文本
-
-        Args:
-            article: 文章信息
-            index: 文章序号
+        去除重复文章，保留首次出现的文章
 
-        Returns:
-            str: 格式化的文章文本
-        """
-        # 基本信息
-        title = article.get('title', 'N/A')
-        journal = article.get('journal', 'N/A')
-        # 显示所有作者，不截断
-        authors_list = article.get('authors', [])
-        if authors_list:
-            authors = ', '.join(authors_list)
-        else:
-            authors = 'N/A'
-        link = article.get('link', '')
-
-        # AI评估信息
-        ai_info = ""
-        if self.include_ai_evaluation and 'ai_evaluation' in article:
-            eval_data = article['ai_evaluation']
-            score = eval_data.get('score', 0)
-            description = eval_data.get('description', '')
-            application_areas = eval_data.get('application_areas', [])
-            
-            # 构建AI评估信息
-            ai_parts = [f"⭐ 评分: {score}"]
-            
-            # 添加应用领域
-            if application_areas:
-                areas_display = ', '.join(application_areas[:3])  # 最多显示3个领域
-                ai_parts.append(f"🔬 领域: {areas_display}")
-            
-            # 添加AI总结描述
-            if description:
-                ai_parts.append(f"� AI总结: {description}")
-            
-            ai_info = "\n🤖 " + " | ".join(ai_parts)
-
-        # 摘要信息
-        abstract_info = ""
-        if self.include_abstract and article.get('abstract'):
-            abstract = article['abstract']
-            if self.abstract_max_length > 0 and len(abstract) > self.abstract_max_length:
-                abstract = abstract[:self.abstract_max_length] + "..."
-            abstract_info = f"\n📄 摘要: {abstract}"
-
-        # 格式化单篇文章
-        article_text = f"""
-{index}. {title}
-   📰 期刊: {journal}
-   👥 作者: {authors}{ai_info}{abstract_info}
-   🔗 [查看原文]({link})"""
-
-        return article_text
-
-    def _prepare_message(self, all_results: Dict[str, List[Dict[str, Any]]],
-                        filtered_articles: List[Dict[str, Any]],
-                        search_days: int) -> Dict[str, Any]:
-        """
-        准备推送消息内容（卡片消息格式）
+        同一篇文章可能出现在多个期刊的搜索结果中，按DOI、链接或标题判定重复；
+        启用 fuzzy_dedup 时，标题SimHash汉明距离不超过阈值的文章也视为重复
 
         Args:
-            all_results: 原始搜索结果
-            filtered_articles: 过滤后的文章
-            search_days: 搜索天数
+            articles: 文章列表
 
         Returns:
-            Dict[str, Any]: 卡片消息结构
+            List[Dict]: 去重后的文章列表
         """
-        # 计算统计信息
-        journal_count = len(all_results)
-        total_articles = sum(len(articles) for articles in all_results.values())
+        seen = set()
+        # SimHash分段索引: (段序号, 段值) -> 指纹列表
+        bands: Dict[tuple, List[int]] = {}
+        unique = []
 
-        # 构建卡片消息
-        return self._build_card_message(all_results, filtered_articles, search_days, 
-                                       journal_count, total_articles)
+        for article in articles:
+            key = (
+                (article.get("doi") or article.get("link") or article.get("title") or "")
+                .lower()
+                .strip()
+            )
+            if key:
+                digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest()
+                if digest in seen:
+                    continue
+                seen.add(digest)
+
+            if self._fuzzy_dedup and (fingerprint := _simhash(article.get("title", ""))):
+                band_keys = [
+                    (i, (fingerprint >> (i * _SIMHASH_BAND_BITS)) & _SIMHASH_BAND_MASK)
+                    for i in range(_SIMHASH_BANDS)
+                ]
+                if any(
+                    bin(fingerprint ^ other).count("1") <= _SIMHASH_MAX_DISTANCE
+                    for band_key in band_keys
+                    for other in bands.get(band_key, ())
+                ):
+                    continue
+                for band_key in band_keys:
+                    bands.setdefault(band_key, []).append(fingerprint)
+
+            unique.append(article)
+
+        if len(unique) < len(articles):
+            logger.info(
+                "🔁 推送去重: 共 %d 篇，去除重复 %d 篇", len(articles), len(articles) - len(unique)
+            )
+        return unique
 
     def _format_articles(self, articles: List[Dict[str, Any]]) -> str:
         """
@@ -167,69 +598,22 @@ class FeishuPusher:
             str: 格式化的文章内容
         """
         if not articles:
-            return "📭 本次搜索未找到符合条件的文章"
+            return self._labels["no_articles"]
 
         # 限制推送文章数量
-        articles_to_push = articles[:self.max_articles_per_push]
+        articles_to_push = articles[: self.max_articles_per_push]
 
-        formatted_articles = []
-
-        for i, article in enumerate(articles_to_push, 1):
-            # 基本信息
-            title = article.get('title', 'N/A')
-            journal = article.get('journal', 'N/A')
-            # 显示所有作者，不截断
-            authors_list = article.get('authors', [])
-            if authors_list:
-                authors = ', '.join(authors_list)
-            else:
-                authors = 'N/A'
-            link = article.get('link', '')
-
-            # AI评估信息
-            ai_info = ""
-            if self.include_ai_evaluation and 'ai_evaluation' in article:
-                eval_data = article['ai_evaluation']
-                score = eval_data.get('score', 0)
-                description = eval_data.get('description', '')
-                application_areas = eval_data.get('application_areas', [])
-                
-                # 构建AI评估信息
-                ai_parts = [f"⭐ 评分: {score}"]
-                
-                # 添加应用领域
-                if application_areas:
-                    areas_display = ', '.join(application_areas[:3])  # 最多显示3个领域
-                    ai_parts.append(f"🔬 领域: {areas_display}")
-                
-                # 添加AI总结描述
-                if description:
-                    ai_parts.append(f"� AI总结: {description}")
-                
-                ai_info = "\n🤖 **AI评估**: " + " | ".join(ai_parts)
-
-            # 摘要信息
-            abstract_info = ""
-            if self.include_abstract and article.get('abstract'):
-                abstract = article['abstract']
-                if self.abstract_max_length > 0 and len(abstract) > self.abstract_max_length:
-                    abstract = abstract[:self.abstract_max_length] + "..."
-                abstract_info = f"\n📄 **摘要**: {abstract}"
-
-            # 格式化单篇文章
-            article_text = f"""
-{i}. **{title}**
-   📰 **期刊**: {journal}
-   👥 **作者**: {authors}{ai_info}{abstract_info}
-   🔗 [查看原文]({link})"""
-
-            formatted_articles.append(article_text)
-
-        return "\n".join(formatted_articles)
+        return "\n\n".join(
+            self._format_article_markdown(article, i)
+            for i, article in enumerate(articles_to_push, 1)
+        )
 
     def _format_article_markdown(self, article: Dict[str, Any], index: int) -> str:
         """
-        格式化单篇文章为Markdown格式
+        格式化单篇文章为Markdown格式，同一篇文章以相同序号重复格式化时使用缓存
+
+        语言和显示选项在推送器生命周期内不变，缓存键只需文章对象和序号；
+        缓存中保留文章对象的引用，避免对象被回收后id被复用。
 
         Args:
             article: 文章信息
@@ -238,69 +622,94 @@ class FeishuPusher:
         Returns:
             str: Markdown格式的文章内容
         """
-        # 基本信息
-        title = article.get('title', 'N/A')
-        journal = article.get('journal', 'N/A')
-        # 显示所有作者，不截断
-        authors_list = article.get('authors', [])
-        if authors_list:
-            authors = ', '.join(authors_list)
-        else:
-            authors = 'N/A'
-        link = article.get('link', '')
-        
-        # 构建文章内容
-        content_parts = [f"**{index}. {title}**"]
-        journal_label = "📰 **Journal**: " if self.language == 'en' else "📰 **期刊**: "
-        authors_label = "👥 **Authors**: " if self.language == 'en' else "👥 **作者**: "
-        content_parts.append(f"{journal_label}{journal}")
-        content_parts.append(f"{authors_label}{authors}")
-        
-        # AI评估信息
-        if self.include_ai_evaluation and 'ai_evaluation' in article:
-            eval_data = article['ai_evaluation']
-            score = eval_data.get('score', 0)
-            description = eval_data.get('description', '')
-            application_areas = eval_data.get('application_areas', [])
-            
-            # 根据语言设置显示不同的标签
-            if self.language == 'en':
-                ai_parts = [f"⭐ Score: {score}"]
-                if application_areas:
-                    areas_display = ', '.join(application_areas[:3])
-                    ai_parts.append(f"🔬 Areas: {areas_display}")
-                if description:
-                    ai_parts.append(f"💡 AI Summary: {description}")
-                content_parts.append(f"🤖 **AI Evaluation**: {' | '.join(ai_parts)}")
+        key = (id(article), index)
+        cached = self._md_cache.get(key)
+        if cached is not None and cached[0] is article:
+            return cached[1]
+
+        content = self._render_article(article, index)
+        self._md_cache[key] = (article, content)
+        return content
+
+    def _make_formatter(self) -> Callable[[Dict[str, Any], int], str]:
+        """
+        生成单篇文章的Markdown格式化函数
+
+        语言和显示选项在推送器生命周期内不变，在此一次性读取并绑定到闭包中，
+        格式化每篇文章时只需根据文章内容进行判断
+
+        Returns:
+            Callable: 格式化函数，参数为文章信息和文章序号，返回Markdown格式的文章内容
+        """
+        labels = self._labels
+        include_ai_evaluation = self.include_ai_evaluation
+        include_abstract = self.include_abstract
+        abstract_max_length = self.abstract_max_length
+        max_authors = self.max_authors
+        journal_label = labels["journal"]
+        authors_label = labels["authors"]
+        ai_evaluation_label = labels["ai_evaluation"]
+        score_label = labels["score"]
+        areas_label = labels["areas"]
+        summary_label = labels["summary"]
+        abstract_label = labels["abstract"]
+        link_template = labels["link"]
+
+        def render(article: Dict[str, Any], index: int) -> str:
+            # 基本信息
+            title = article.get("title", "N/A")
+            journal = article.get("journal", "N/A")
+            # 作者过多时只显示前 max_authors 位
+            authors_list = article.get("authors", [])
+            if not authors_list:
+                authors = "N/A"
+            elif 0 < max_authors < len(authors_list):
+                shown = ", ".join(authors_list[:max_authors])
+                authors = f"{shown} et al. (+{len(authors_list) - max_authors})"
             else:
-                ai_parts = [f"⭐ 评分: {score}"]
+                authors = ", ".join(authors_list)
+            link = article.get("link", "")
+
+            # 构建文章内容，依次为：标题、期刊、作者、AI评估、摘要、链接，未启用的部分为None
+            content_parts = [None] * 6
+            content_parts[0] = f"**{index}. {title}**"
+            content_parts[1] = f"{journal_label}{journal}"
+            content_parts[2] = f"{authors_label}{authors}"
+
+            # AI评估信息
+            if include_ai_evaluation and (eval_data := article.get("ai_evaluation")) is not None:
+                score = eval_data.get("score", 0)
+                description = eval_data.get("description", "")
+                application_areas = eval_data.get("application_areas", [])
+
+                ai_parts = [f"{score_label}{score}", None, None]
                 if application_areas:
-                    areas_display = ', '.join(application_areas[:3])
-                    ai_parts.append(f"🔬 领域: {areas_display}")
+                    areas_display = ", ".join(islice(application_areas, 3))
+                    ai_parts[1] = f"{areas_label}{areas_display}"
                 if description:
-                    ai_parts.append(f"💡 AI总结: {description}")
-                content_parts.append(f"🤖 **AI评估**: {' | '.join(ai_parts)}")
-        
-        # 摘要信息
-        if self.include_abstract and article.get('abstract'):
-            abstract = article['abstract']
-            if self.abstract_max_length > 0 and len(abstract) > self.abstract_max_length:
-                abstract = abstract[:self.abstract_max_length] + "..."
-            abstract_label = "📄 **Abstract**: " if self.language == 'en' else "📄 **摘要**: "
-            content_parts.append(f"{abstract_label}{abstract}")
-        
-        # 链接
-        if link:
-            link_text = "[View Article]({link})" if self.language == 'en' else "[查看原文]({link})"
-            content_parts.append(f"🔗 {link_text.format(link=link)}")
-        
-        return "\n".join(content_parts)
-    
-    def _build_card_message(self, all_results: Dict[str, List[Dict[str, Any]]],
-                           filtered_articles: List[Dict[str, Any]],
-                           search_days: int,
-                           journal_count: int,
-                           total_articles: int) -> Dict[str, Any]:
+                    ai_parts[2] = f"{summary_label}{description}"
+                content_parts[3] = f"{ai_evaluation_label}{' | '.join(filter(None, ai_parts))}"
+
+            # 摘要信息
+            if include_abstract and (abstract := article.get("abstract")):
+                if 0 < abstract_max_length < len(abstract):
+                    abstract = f"{abstract[:abstract_max_length]}{_ELLIPSIS}"
+                content_parts[4] = f"{abstract_label}{abstract}"
+
+            # 链接
+            if link:
+                content_parts[5] = link_template.format(link=link)
+
+            return "\n".join(filter(None, content_parts))
+
+        return render
+
+    def _build_card_message(
+        self,
+        all_results: Dict[str, List[Dict[str, Any]]],
+        filtered_articles: List[Dict[str, Any]],
+        search_days: int,
+    ) -> Dict[str, Any]:
         """
         构建飞书卡片消息结构
 
@@ -308,98 +717,103 @@ class FeishuPusher:
             all_results: 原始搜索结果
             filtered_articles: 过滤后的文章
             search_days: 搜索天数
-            journal_count: 期刊数量
-            total_articles: 总文章数
 
         Returns:
             Dict[str, Any]: 卡片消息结构
         """
-        elements = []
-        
+        # 计算统计信息
+        journal_count = 0
+        total_articles = 0
+        for articles in all_results.values():
+            journal_count += 1
+            total_articles += len(articles)
+
         # 标题部分
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        if self.language == 'en':
-            header_content = f"""**📰 Biological Article Push**
-
-**📊 Search Statistics**
-- Journals searched: {journal_count}
-- Candidate articles: {total_articles}
-- After AI filtering: {len(filtered_articles)}
-- Generated at: {timestamp}"""
-        else:
-            header_content = f"""**📰 生物文章推送**
-
-**📊 搜索统计**
-- 搜索期刊: {journal_count} 个
-- 候选文章: {total_articles} 篇
-- AI筛选后: {len(filtered_articles)} 篇
-- 生成时间: {timestamp}"""
-        
-        elements.append({
-            "tag": "div",
-            "text": {
-                "tag": "lark_md",
-                "content": header_content
-            }
-        })
-        
-        # 分隔线
-        elements.append({"tag": "hr"})
-        
-        # 文章列表
-        if not filtered_articles:
-            no_articles_msg = "📭 No articles found matching the criteria" if self.language == 'en' else "📭 本次搜索未找到符合条件的文章"
-            elements.append({
-                "tag": "div",
-                "text": {
-                    "tag": "lark_md",
-                    "content": no_articles_msg
-                }
-            })
+        header_content = self._build_header(journal_count, total_articles, len(filtered_articles))
+
+        # 文章列表（限制推送文章数量）
+        articles_to_push = filtered_articles[: self.max_articles_per_push]
+        n = len(articles_to_push)
+
+        # 标题、分隔线、文章列表（文章之间以分隔线隔开）、分隔线、底部信息，
+        # 按最终长度预分配，分隔线位置直接由共享的 _HR 占据
+        elements: List[Dict[str, Any]] = [_HR] * (2 * max(n, 1) + 3)
+        elements[0] = _lark_div(header_content)
+        if n:
+            elements[2 : 2 * n + 1 : 2] = [
+                _lark_div(self._format_article_markdown(article, i))
+                for i, article in enumerate(articles_to_push, 1)
+            ]
         else:
-            # 限制推送文章数量
-            articles_to_push = filtered_articles[:self.max_articles_per_push]
-            
-            for i, article in enumerate(articles_to_push, 1):
-                # 每篇文章作为一个div
-                article_content = self._format_article_markdown(article, i)
-                elements.append({
-                    "tag": "div",
-                    "text": {
-                        "tag": "lark_md",
-                        "content": article_content
-                    }
-                })
-                
-                # 文章之间添加分隔线（除了最后一篇）
-                if i < len(articles_to_push):
-                    elements.append({"tag": "hr"})
-        
-        # 底部信息
-        elements.append({"tag": "hr"})
-        footer_text = "🤖 *AI Smart Filtering | Biological Article Push*" if self.language == 'en' else "🤖 *AI智能筛选 | 生物文章推送*"
-        elements.append({
-            "tag": "div",
-            "text": {
-                "tag": "lark_md",
-                "content": footer_text
-            }
-        })
-        
+            elements[2] = _lark_div(self._labels["no_articles"])
+        elements[-1] = self._footer_div
+
         # 构建卡片消息
         card_message = {
             "msg_type": "interactive",
-            "card": {
-                "config": {
-                    "wide_screen_mode": True
-                },
-                "elements": elements
-            }
+            "card": {"config": _CARD_CONFIG, "elements": elements},
         }
-        
+
         return card_message
 
-    def _group_articles_by_topic(self, articles: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    def _build_header(
+        self,
+        journal_count: int,
+        total_articles: int,
+        filtered_count: int,
+        card_num: int = 1,
+        card_count: int = 1,
+    ) -> str:
+        """
+        构建消息标题（搜索统计）
+
+        Args:
+            journal_count: 期刊数量
+            total_articles: 总文章数
+            filtered_count: 过滤后文章数
+            card_num: 当前消息序号
+            card_count: 本次推送的消息总数，大于1时显示消息序号
+
+        Returns:
+            str: lark_md格式的标题内容
+        """
+        labels = self._labels
+        count_suffix = labels["count_suffix"]
+        header_parts = [
+            labels["header_prefix"],
+            f"{labels['journal_count']}{journal_count}{labels['journal_suffix']}",
+            f"{labels['total_articles']}{total_articles}{count_suffix}",
+            f"{labels['filtered_count']}{filtered_count}{count_suffix}",
+            f"{labels['generated_at']}{datetime.now().isoformat(sep=' ', timespec='seconds')}",
+        ]
+        if card_count > 1:
+            header_parts.append(f"{labels['part']}{card_num}/{card_count}")
+        return "\n".join(header_parts)
+
+    def _article_elements(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        将文章列表转换为卡片元素，文章之间以分隔线隔开
+
+        Args:
+            articles: 文章列表
+
+        Returns:
+            List[Dict]: 卡片元素列表
+        """
+        if not articles:
+            return []
+
+        # 按最终长度预分配，偶数位置为文章，奇数位置为共享的分隔线
+        body: List[Dict[str, Any]] = [_HR] * (2 * len(articles) - 1)
+        body[::2] = [
+            _lark_div(self._format_article_markdown(article, i))
+            for i, article in enumerate(articles, 1)
+        ]
+        return body
+
+    def _group_articles_by_topic(
+        self, articles: List[Dict[str, Any]]
+    ) -> Dict[str, List[Dict[str, Any]]]:
         """
         按主题分组文章
 
@@ -409,32 +823,29 @@ class FeishuPusher:
         Returns:
             Dict[str, List[Dict]]: 按主题分组的文章字典
         """
-        topic_groups = {}
-        
+        topic_groups = defaultdict(list)
+
         for article in articles:
-            # 获取文章的主题
-            topic = "other"  # 默认主题
-            if 'ai_evaluation' in article:
-                ai_eval = article['ai_evaluation']
-                topic = ai_eval.get('topic', 'other')
-            
+            # 获取文章的主题，未经AI评估的文章归入默认主题
+            topic = (article.get("ai_evaluation") or _EMPTY).get("topic", "other")
+
             # 标准化主题名称
-            topic = topic.lower().strip()
-            if not topic or topic == '':
-                topic = 'other'
-            
-            # 添加到对应主题组
-            if topic not in topic_groups:
-                topic_groups[topic] = []
+            topic = topic.lower().strip() or "other"
             topic_groups[topic].append(article)
-        
+
         return topic_groups
-    
-    def _push_by_topics(self, all_results: Dict[str, List[Dict[str, Any]]],
-                       filtered_articles: List[Dict[str, Any]],
-                       search_days: int) -> bool:
+
+    def _push_by_topics(
+        self,
+        all_results: Dict[str, List[Dict[str, Any]]],
+        filtered_articles: List[Dict[str, Any]],
+        search_days: int,
+    ) -> bool:
         """
-        按主题分批次推送文章
+        按主题分组推送文章
+
+        每个主题（文章数超过单条上限时为主题的每一批）作为一个分组，多个分组合并到同一条
+        消息中推送，仅在消息接近飞书卡片大小或元素数上限时才拆分为多条消息。
 
         Args:
             all_results: 原始搜索结果
@@ -446,79 +857,188 @@ class FeishuPusher:
         """
         # 按主题分组
         topic_groups = self._group_articles_by_topic(filtered_articles)
-        
-        logger.info(f"📊 文章已按主题分组，共 {len(topic_groups)} 个主题")
+
+        logger.info("📊 文章已按主题分组，共 %d 个主题", len(topic_groups))
         for topic, articles in topic_groups.items():
-            logger.info(f"  - {topic}: {len(articles)} 篇文章")
-        
+            logger.info("  - %s: %d 篇文章", topic, len(articles))
+
         # 计算统计信息
         journal_count = len(all_results)
         total_articles = sum(len(articles) for articles in all_results.values())
-        
-        # 按主题顺序推送（按文章数量降序）
+
+        # 按主题顺序排列（按文章数量降序）
         sorted_topics = sorted(topic_groups.items(), key=lambda x: len(x[1]), reverse=True)
-        
-        all_success = True
-        topic_index = 0
-        
+
+        # 构建各主题分组，主题文章超过单条消息限制时分为多批
+        per_push = self.max_articles_per_push
+        sections = []
         for topic, topic_articles in sorted_topics:
-            topic_index += 1
             topic_name_display = self._get_topic_display_name(topic)
-            
-            logger.info(f"📤 推送主题 [{topic_index}/{len(sorted_topics)}]: {topic_name_display} ({len(topic_articles)} 篇文章)")
-            
-            # 如果该主题的文章超过单条消息限制，需要分批推送
-            if len(topic_articles) > self.max_articles_per_push:
-                # 分批推送
-                batch_count = (len(topic_articles) + self.max_articles_per_push - 1) // self.max_articles_per_push
-                logger.info(f"  ⚠️ 主题文章数量超过限制，将分为 {batch_count} 批推送")
-                
-                for batch_idx in range(batch_count):
-                    start_idx = batch_idx * self.max_articles_per_push
-                    end_idx = min(start_idx + self.max_articles_per_push, len(topic_articles))
-                    batch_articles = topic_articles[start_idx:end_idx]
-                    
-                    logger.info(f"  📨 推送第 {batch_idx + 1}/{batch_count} 批 ({len(batch_articles)} 篇文章)")
-                    
-                    # 构建该批次的推送消息
-                    card_message = self._build_topic_message(
-                        all_results, batch_articles, search_days,
-                        journal_count, total_articles, len(filtered_articles),
-                        topic_name_display, batch_idx + 1, batch_count
+            batch_count = (len(topic_articles) + per_push - 1) // per_push
+            if batch_count > 1:
+                logger.info(
+                    "  ⚠️ 主题 %s 文章数量超过限制，将分为 %d 批", topic_name_display, batch_count
+                )
+            for batch_idx in range(batch_count):
+                batch_articles = topic_articles[batch_idx * per_push : (batch_idx + 1) * per_push]
+                sections.append(
+                    self._build_topic_section(
+                        topic_name_display, batch_articles, batch_idx + 1, batch_count
                     )
-                    
-                    # 发送推送
-                    if not self._send_to_feishu(card_message):
-                        all_success = False
-                        logger.error(f"  ❌ 主题 {topic_name_display} 第 {batch_idx + 1} 批推送失败")
-                    else:
-                        logger.info(f"  ✅ 主题 {topic_name_display} 第 {batch_idx + 1} 批推送成功")
-                    
-                    # 批次之间稍作延迟，避免请求过快
-                    if batch_idx < batch_count - 1:
-                        import time
-                        time.sleep(0.5)
-            else:
-                # 单批推送
-                card_message = self._build_topic_message(
-                    all_results, topic_articles, search_days,
-                    journal_count, total_articles, len(filtered_articles),
-                    topic_name_display, 1, 1
                 )
-                
-                if not self._send_to_feishu(card_message):
-                    all_success = False
-                    logger.error(f"  ❌ 主题 {topic_name_display} 推送失败")
-                else:
-                    logger.info(f"  ✅ 主题 {topic_name_display} 推送成功")
-        
+
+        # 合并分组为尽量少的消息
+        card_bodies = self._pack_topic_sections(sections)
+
+        card_count = len(card_bodies)
+        card_messages = [
+            self._build_multi_topic_message(
+                body, journal_count, total_articles, len(filtered_articles), card_num, card_count
+            )
+            for card_num, body in enumerate(card_bodies, 1)
+        ]
+
+        # 默认按编号顺序发送，同一主题的多批文章在群聊中按顺序出现；
+        # 启用 concurrent_cards 时并发发送，由令牌桶统一限速；缓冲模式下写入缓冲区，保持顺序执行
+        if self._concurrent_cards and card_count > 1 and self._buffer is None:
+            logger.info("📤 并发推送 %d 条消息", card_count)
+            with ThreadPoolExecutor(max_workers=min(_MAX_TOPIC_WORKERS, card_count)) as executor:
+                results = list(executor.map(self._send_to_feishu, card_messages))
+        else:
+            results = [self._send_to_feishu(card_message) for card_message in card_messages]
+
+        all_success = True
+        for card_num, ok in enumerate(results, 1):
+            if ok:
+                logger.info("  ✅ 第 %d/%d 条消息推送成功", card_num, card_count)
+            else:
+                all_success = False
+                logger.error("  ❌ 第 %d/%d 条消息推送失败", card_num, card_count)
+
         if all_success:
-            logger.info(f"✅ 所有主题推送完成，共推送 {len(sorted_topics)} 个主题")
+            logger.info(
+                "✅ 所有主题推送完成，共 %d 个主题，%d 条消息", len(sorted_topics), len(card_bodies)
+            )
         else:
-            logger.warning(f"⚠️ 部分主题推送失败，共 {len(sorted_topics)} 个主题")
-        
+            logger.warning(
+                "⚠️ 部分消息推送失败，共 %d 个主题，%d 条消息", len(sorted_topics), len(card_bodies)
+            )
+
         return all_success
-    
+
+    def _build_topic_section(
+        self,
+        topic_name: str,
+        articles: List[Dict[str, Any]],
+        batch_num: int = 1,
+        total_batches: int = 1,
+    ) -> List[Dict[str, Any]]:
+        """
+        构建单个主题分组的卡片元素：主题标题和文章列表
+
+        Args:
+            topic_name: 主题显示名称
+            articles: 该分组的文章列表
+            batch_num: 当前批次号
+            total_batches: 该主题的总批次数
+
+        Returns:
+            List[Dict]: 卡片元素列表
+        """
+        labels = self._labels
+        title_parts = [
+            labels["topic_section"].format(topic_name=topic_name, topic_count=len(articles))
+        ]
+        if total_batches > 1:
+            title_parts.append(
+                labels["topic_batch"].format(batch_num=batch_num, total_batches=total_batches)
+            )
+        return [_lark_div("".join(title_parts)), *self._article_elements(articles)]
+
+    def _pack_topic_sections(
+        self, sections: List[List[Dict[str, Any]]]
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        将主题分组依次合并为消息正文，每条消息不超过飞书卡片的大小和元素数上限
+
+        单个分组本身超过上限时先按文章拆分，仍超过上限的单篇文章单独成为一条消息。
+
+        Args:
+            sections: 各主题分组的卡片元素列表
+
+        Returns:
+            List[List[Dict]]: 每条消息的正文元素列表
+        """
+        byte_budget = _MAX_CARD_BYTES - _CARD_OVERHEAD_BYTES
+        # 标题、两条分隔线和底部信息占用4个元素
+        element_budget = _MAX_CARD_ELEMENTS - 4
+
+        bodies = []
+        current: List[Dict[str, Any]] = []
+        current_bytes = 0
+        for section, section_bytes in chain.from_iterable(
+            self._split_topic_section(section, byte_budget, element_budget) for section in sections
+        ):
+            if current and (
+                current_bytes + section_bytes > byte_budget
+                or len(current) + 1 + len(section) > element_budget
+            ):
+                bodies.append(current)
+                current = []
+                current_bytes = 0
+
+            if current:
+                # 不同主题之间添加分隔线
+                current.append(_HR)
+            current.extend(section)
+            current_bytes += section_bytes
+
+        if current:
+            bodies.append(current)
+        return bodies
+
+    def _split_topic_section(
+        self, section: List[Dict[str, Any]], byte_budget: int, element_budget: int
+    ) -> Iterator[Tuple[List[Dict[str, Any]], int]]:
+        """
+        将超过单条消息上限的主题分组按文章拆分，每部分都带有主题标题
+
+        Args:
+            section: 主题分组的卡片元素列表，依次为主题标题和以分隔线隔开的文章
+            byte_budget: 单条消息正文的字节数上限
+            element_budget: 单条消息正文的元素数上限
+
+        Yields:
+            Tuple[List[Dict], int]: 拆分后的卡片元素列表及其序列化字节数
+        """
+        sizes = [len(_dumps(element)) for element in section]
+        section_bytes = sum(sizes)
+        if section_bytes <= byte_budget and len(section) <= element_budget:
+            yield section, section_bytes
+            return
+
+        title, title_bytes = section[0], sizes[0]
+        hr_bytes = len(_dumps(_HR))
+        part = [title]
+        part_bytes = title_bytes
+        # 文章元素位于奇数位置，其间为分隔线
+        for i in range(1, len(section), 2):
+            article, article_bytes = section[i], sizes[i]
+            if len(part) > 1 and (
+                part_bytes + hr_bytes + article_bytes > byte_budget
+                or len(part) + 2 > element_budget
+            ):
+                yield part, part_bytes
+                part = [title]
+                part_bytes = title_bytes
+            if len(part) > 1:
+                part.append(_HR)
+                part_bytes += hr_bytes
+            part.append(article)
+            part_bytes += article_bytes
+
+        yield part, part_bytes
+
     def _get_topic_display_name(self, topic: str) -> str:
         """
         获取主题的显示名称
@@ -529,171 +1049,161 @@ class FeishuPusher:
         Returns:
             str: 显示名称
         """
-        topic_names = {
-            'single-cell': '单细胞分析' if self.language == 'zh' else 'Single-cell Analysis',
-            'genomics': '基因组学' if self.language == 'zh' else 'Genomics',
-            'proteomics': '蛋白质组学' if self.language == 'zh' else 'Proteomics',
-            'metabolomics': '代谢组学' if self.language == 'zh' else 'Metabolomics',
-            'network': '网络分析' if self.language == 'zh' else 'Network Analysis',
-            'simulation': '模拟建模' if self.language == 'zh' else 'Simulation',
-            'foundation_model': '基础模型' if self.language == 'zh' else 'Foundation Model',
-            'aging': '衰老研究' if self.language == 'zh' else 'Aging',
-            'other': '其他' if self.language == 'zh' else 'Other'
-        }
-        return topic_names.get(topic.lower(), topic)
-    
-    def _build_topic_message(self, all_results: Dict[str, List[Dict[str, Any]]],
-                            topic_articles: List[Dict[str, Any]],
-                            search_days: int,
-                            journal_count: int,
-                            total_articles: int,
-                            filtered_count: int,
-                            topic_name: str,
-                            batch_num: int = 1,
-                            total_batches: int = 1) -> Dict[str, Any]:
-        """
-        构建主题推送消息
+        return self._topic_names.get(topic.lower(), topic)
+
+    def _build_multi_topic_message(
+        self,
+        body: List[Dict[str, Any]],
+        journal_count: int,
+        total_articles: int,
+        filtered_count: int,
+        card_num: int = 1,
+        card_count: int = 1,
+    ) -> Dict[str, Any]:
+        """
+        构建包含多个主题分组的推送消息
 
         Args:
-            all_results: 原始搜索结果
-            topic_articles: 该主题的文章列表
-            search_days: 搜索天数
+            body: 消息正文元素（一个或多个主题分组）
             journal_count: 期刊数量
             total_articles: 总文章数
             filtered_count: 过滤后文章总数
-            topic_name: 主题名称
-            batch_num: 当前批次号
-            total_batches: 总批次数
+            card_num: 当前消息序号
+            card_count: 本次推送的消息总数
 
         Returns:
             Dict[str, Any]: 卡片消息结构
         """
-        elements = []
-        
         # 标题部分
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        if self.language == 'en':
-            header_content = f"""**📰 Biological Article Push - {topic_name}**
-
-**📊 Search Statistics**
-- Journals searched: {journal_count}
-- Candidate articles: {total_articles}
-- After AI filtering: {filtered_count}
-- Topic: {topic_name} ({len(topic_articles)} articles)"""
-            if total_batches > 1:
-                header_content += f"\n- Batch: {batch_num}/{total_batches}"
-            header_content += f"\n- Generated at: {timestamp}"""
-        else:
-            header_content = f"""**📰 生物文章推送 - {topic_name}**
-
-**📊 搜索统计**
-- 搜索期刊: {journal_count} 个
-- 候选文章: {total_articles} 篇
-- AI筛选后: {filtered_count} 篇
-- 主题: {topic_name} ({len(topic_articles)} 篇)"""
-            if total_batches > 1:
-                header_content += f"\n- 批次: {batch_num}/{total_batches}"
-            header_content += f"\n- 生成时间: {timestamp}"""
-        
-        elements.append({
-            "tag": "div",
-            "text": {
-                "tag": "lark_md",
-                "content": header_content
-            }
-        })
-        
-        # 分隔线
-        elements.append({"tag": "hr"})
-        
-        # 文章列表
-        if not topic_articles:
-            no_articles_msg = "📭 No articles found" if self.language == 'en' else "📭 未找到文章"
-            elements.append({
-                "tag": "div",
-                "text": {
-                    "tag": "lark_md",
-                    "content": no_articles_msg
-                }
-            })
-        else:
-            for i, article in enumerate(topic_articles, 1):
-                # 每篇文章作为一个div
-                article_content = self._format_article_markdown(article, i)
-                elements.append({
-                    "tag": "div",
-                    "text": {
-                        "tag": "lark_md",
-                        "content": article_content
-                    }
-                })
-                
-                # 文章之间添加分隔线（除了最后一篇）
-                if i < len(topic_articles):
-                    elements.append({"tag": "hr"})
-        
-        # 底部信息
-        elements.append({"tag": "hr"})
-        footer_text = f"🤖 *AI Smart Filtering | {topic_name}*" if self.language == 'en' else f"🤖 *AI智能筛选 | {topic_name}*"
-        elements.append({
-            "tag": "div",
-            "text": {
-                "tag": "lark_md",
-                "content": footer_text
-            }
-        })
-        
+        header_content = self._build_header(
+            journal_count, total_articles, filtered_count, card_num, card_count
+        )
+
+        # 标题、分隔线、主题分组、分隔线、底部信息
+        elements = [_lark_div(header_content), _HR, *body, _HR, self._footer_div]
+
         # 构建卡片消息
         card_message = {
             "msg_type": "interactive",
-            "card": {
-                "config": {
-                    "wide_screen_mode": True
-                },
-                "elements": elements
-            }
+            "card": {"config": _CARD_CONFIG, "elements": elements},
         }
-        
+
         return card_message
 
-    def _send_to_feishu(self, card_message: Dict[str, Any]) -> bool:
+    def _send_to_feishu(self, card_message: Union[Dict[str, Any], bytes]) -> bool:
         """
         发送卡片消息到飞书
 
         Args:
-            card_message: 卡片消息结构
+            card_message: 卡片消息结构，或已序列化的JSON字节串
 
         Returns:
             bool: 发送是否成功
         """
-        try:
-            headers = {
-                "Content-Type": "application/json"
-            }
-
-            response = requests.post(
-                self.webhook_url,
-                headers=headers,
-                json=card_message,
-                timeout=30
-            )
+        if self._buffer is not None and not isinstance(card_message, bytes):
+            return self._append_to_buffer(card_message["card"]["elements"])
+
+        # 同一进程内短时间重复推送相同内容（如流水线或长期运行的服务重复触发）时跳过
+        digest = self._card_digest(card_message) if self._dedupe_ttl > 0 else None
+        if digest is not None:
+            with _recent_pushes_lock:
+                sent_at = _recent_pushes.get(digest)
+            if sent_at is not None and time.monotonic() - sent_at < self._dedupe_ttl:
+                logger.warning(
+                    "⚠️ 与 %s 秒内推送过的消息内容相同，跳过推送（dedupe_ttl_seconds）",
+                    self._dedupe_ttl,
+                )
+                return True
 
-            response.raise_for_status()
+        # 自行序列化为字节串，避免requests再做一次编码；多个webhook共用同一份数据
+        if not isinstance(card_message, bytes):
+            card_message = _dumps(card_message)
 
-            result = response.json()
-            if result.get('code') == 0:
-                logger.info("✅ 飞书推送成功")
-                return True
-            else:
-                logger.error(f"飞书推送失败: {result}")
+        if len(self.webhook_urls) == 1:
+            success = self._post(self.webhook_urls[0], card_message)
+        else:
+            # 并发推送到所有webhook，全部成功才算成功
+            with ThreadPoolExecutor(
+                max_workers=min(_MAX_PUSH_WORKERS, len(self.webhook_urls))
+            ) as executor:
+                success = all(
+                    executor.map(lambda url: self._post(url, card_message), self.webhook_urls)
+                )
+
+        if success and digest is not None:
+            _remember_push(digest, self._dedupe_ttl)
+        return success
+
+    def _card_digest(self, card_message: Union[Dict[str, Any], bytes]) -> bytes:
+        """
+        计算卡片内容摘要，用于识别重复推送
+
+        标题元素包含生成时间，不参与计算；摘要同时区分推送的目标webhook。
+
+        Args:
+            card_message: 卡片消息结构，或已序列化的JSON字节串
+
+        Returns:
+            bytes: 8字节摘要
+        """
+        hasher = hashlib.blake2b(digest_size=8)
+        hasher.update("\n".join(self.webhook_urls).encode("utf-8"))
+        if isinstance(card_message, bytes):
+            hasher.update(card_message)
+        else:
+            for element in card_message.get("card", {}).get("elements", [])[1:]:
+                hasher.update(_dumps(element))
+        return hasher.digest()
+
+    def _post(self, webhook_url: str, body: bytes) -> bool:
+        """
+        向单个webhook发送已序列化的卡片消息
+
+        发送前按webhook限速；被飞书限流时按 Retry-After 或指数退避等待后重试。
+
+        Args:
+            webhook_url: 飞书机器人webhook地址
+            body: UTF-8编码的JSON
+
+        Returns:
+            bool: 发送是否成功
+        """
+        bucket = _get_bucket(webhook_url, self._rate_limit_per_min)
+
+        for attempt in range(_RATE_LIMIT_RETRIES + 1):
+            bucket.acquire()
+            try:
+                response = self._session.post(webhook_url, data=body, timeout=(3.05, 30))
+
+                if response.status_code != 429:
+                    response.raise_for_status()
+
+                    result = response.json()
+                    if result.get("code") == 0:
+                        logger.info("✅ 飞书推送成功")
+                        return True
+                    if result.get("code") not in _RATE_LIMIT_CODES:
+                        logger.error("飞书推送失败: %s", result)
+                        return False
+
+            except requests.exceptions.RequestException as e:
+                logger.error("飞书推送网络错误: %s", e)
+                return False
+            except Exception as e:
+                logger.error("飞书推送未知错误: %s", e)
                 return False
 
-        except requests.exceptions.RequestException as e:
-            logger.error(f"飞书推送网络错误: {e}")
-            return False
-        except Exception as e:
-            logger.error(f"飞书推送未知错误: {e}")
-            return False
+            # 被限流，等待后重试
+            if attempt == _RATE_LIMIT_RETRIES:
+                break
+            delay = _retry_delay(response, attempt)
+            logger.warning(
+                "⏳ 飞书推送被限流，%.1f 秒后重试 (%d/%d)", delay, attempt + 1, _RATE_LIMIT_RETRIES
+            )
+            time.sleep(delay)
+
+        logger.error("飞书推送失败: 重试 %d 次后仍被限流", _RATE_LIMIT_RETRIES)
+        return False
 
 
 def create_feishu_pusher(config: Dict[str, Any]) -> FeishuPusher:
@@ -706,14 +1216,16 @@ def create_feishu_pusher(config: Dict[str, Any]) -> FeishuPusher:
     Returns:
         FeishuPusher: 飞书推送器实例
     """
-    feishu_config = config.get('feishu', {})
+    feishu_config = config.get("feishu", {})
     return FeishuPusher(feishu_config)
 
 
-def push_to_feishu(all_results: Dict[str, List[Dict[str, Any]]],
-                  filtered_articles: List[Dict[str, Any]],
-                  search_days: int,
-                  config: Dict[str, Any]) -> bool:
+def push_to_feishu(
+    all_results: Dict[str, List[Dict[str, Any]]],
+    filtered_articles: List[Dict[str, Any]],
+    search_days: int,
+    config: Dict[str, Any],
+) -> bool:
     """
     推送文章到飞书的便捷函数
 
@@ -728,4 +1240,3 @@ def push_to_feishu(all_results: Dict[str, List[Dict[str, Any]]],
     """
     pusher = create_feishu_pusher(config)
     return pusher.push_articles(all_results, filtered_articles, search_days)
-
@@ -0,0 +1,124 @@
+# llm_cache.py
+"""
+AI响应缓存模块
+将AI评估结果持久化到SQLite，避免重复运行时对同一篇文章重复调用AI接口
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from typing import Dict, Any, Optional
+
+logger = logging.getLogger(__name__)
+
+# 默认缓存有效期：7天
+DEFAULT_CACHE_TTL = 7 * 86400
+
+
+class LLMCache:
+    """基于SQLite的AI响应精确匹配缓存"""
+
+    def __init__(self, path: str = ".llm_cache.sqlite", ttl: int = DEFAULT_CACHE_TTL):
+        """
+        初始化缓存
+
+        Args:
+            path: SQLite数据库文件路径
+            ttl: 缓存有效期（秒），小于等于0表示永不过期
+        """
+        self.path = path
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        # AI评估在线程池中并发执行，连接需要跨线程共享
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, payload TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+            self._conn.commit()
+
+    @staticmethod
+    def make_key(model: str, prompt: str, temperature: float, max_tokens: int) -> str:
+        """
+        根据请求参数生成缓存键
+
+        Args:
+            model: 模型名称
+            prompt: 提示词
+            temperature: 温度参数
+            max_tokens: 最大生成token数
+
+        Returns:
+            str: SHA-256 十六进制缓存键
+        """
+        raw = json.dumps({
+            "model": model,
+            "prompt": prompt.strip(),
+            "temperature": temperature,
+            "max_tokens": max_tokens
+        }, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        读取缓存
+
+        Args:
+            key: 缓存键
+
+        Returns:
+            Optional[Dict]: 命中时返回缓存的评估结果，否则返回None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is not None and self.ttl > 0 and time.time() - row[1] > self.ttl:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._conn.commit()
+                row = None
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+
+        try:
+            return json.loads(row[0])
+        except json.JSONDecodeError:
+            return None
+
+    def set(self, key: str, value: Dict[str, Any]):
+        """
+        写入缓存
+
+        Args:
+            key: 缓存键
+            value: AI评估结果
+        """
+        payload = json.dumps(value, ensure_ascii=False)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, payload, created_at) VALUES (?, ?, ?)",
+                (key, payload, time.time())
+            )
+            self._conn.commit()
+
+    def log_stats(self):
+        """输出缓存命中统计"""
+        total = self.hits + self.misses
+        if total:
+            logger.info(f"💾 AI响应缓存: 命中 {self.hits}/{total} 次 ({self.hits / total:.0%})")
+
+    def close(self):
+        """关闭数据库连接"""
+        with self._lock:
+            self._conn.close()
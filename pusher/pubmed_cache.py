@@ -0,0 +1,186 @@
+# pubmed_cache.py
+"""
+PubMed结果缓存模块
+将PubMed检索结果（PMID列表）和文章详情持久化到SQLite，定时运行时只获取新出现的文章
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from typing import Dict, Any, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 默认文章详情缓存有效期：7天
+DEFAULT_ARTICLE_TTL = 7 * 86400
+
+# 默认检索结果缓存有效期：1小时，过期后重新检索以发现新文章
+DEFAULT_QUERY_TTL = 3600
+
+# 单条SQL语句的最大参数个数
+_MAX_SQL_PARAMS = 500
+
+
+class PubMedCache:
+    """基于SQLite的PubMed检索结果和文章详情缓存"""
+
+    def __init__(self, path: str = ".pubmed_cache.sqlite", ttl: int = DEFAULT_ARTICLE_TTL,
+                 query_ttl: int = DEFAULT_QUERY_TTL):
+        """
+        初始化缓存
+
+        Args:
+            path: SQLite数据库文件路径
+            ttl: 文章详情缓存有效期（秒），小于等于0表示永不过期
+            query_ttl: 检索结果缓存有效期（秒），小于等于0表示不缓存检索结果
+        """
+        self.path = path
+        self.ttl = ttl
+        self.query_ttl = query_ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        # 多个期刊在线程池中并发检索，连接需要跨线程共享
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS queries ("
+                "qhash TEXT PRIMARY KEY, pmids TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS articles ("
+                "pmid TEXT PRIMARY KEY, payload TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+            self._conn.commit()
+
+    @staticmethod
+    def _query_hash(params: Dict[str, Any]) -> str:
+        """
+        生成检索请求的缓存键
+
+        检索式本身包含日期范围，其余参数（如 retmax、sort）也会影响返回的PMID列表，
+        因此全部参与计算
+
+        Args:
+            params: esearch请求参数（不含API key）
+
+        Returns:
+            str: SHA-256 十六进制缓存键
+        """
+        raw = json.dumps(params, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def get_query(self, params: Dict[str, Any]) -> Optional[List[str]]:
+        """
+        读取检索结果
+
+        Args:
+            params: esearch请求参数（不含API key）
+
+        Returns:
+            Optional[List[str]]: 命中时返回PMID列表，否则返回None
+        """
+        if self.query_ttl <= 0:
+            return None
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT pmids, created_at FROM queries WHERE qhash = ?", (self._query_hash(params),)
+            ).fetchone()
+
+        if row is None or time.time() - row[1] > self.query_ttl:
+            return None
+        return json.loads(row[0])
+
+    def set_query(self, params: Dict[str, Any], pmids: List[str]):
+        """
+        写入检索结果
+
+        Args:
+            params: esearch请求参数（不含API key）
+            pmids: PMID列表
+        """
+        if self.query_ttl <= 0:
+            return
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO queries (qhash, pmids, created_at) VALUES (?, ?, ?)",
+                (self._query_hash(params), json.dumps(pmids), time.time())
+            )
+            self._conn.commit()
+
+    def get_articles(self, pmids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        批量读取文章详情
+
+        Args:
+            pmids: PMID列表
+
+        Returns:
+            Dict[str, Dict]: 命中的文章，PMID -> 文章信息
+        """
+        if not pmids:
+            return {}
+
+        rows = []
+        with self._lock:
+            # 分段查询，避免超过SQLite单条语句的参数个数上限
+            for start in range(0, len(pmids), _MAX_SQL_PARAMS):
+                chunk = pmids[start:start + _MAX_SQL_PARAMS]
+                placeholders = ",".join("?" * len(chunk))
+                rows.extend(self._conn.execute(
+                    f"SELECT pmid, payload, created_at FROM articles WHERE pmid IN ({placeholders})",
+                    chunk
+                ).fetchall())
+
+        now = time.time()
+        articles = {}
+        for pmid, payload, created_at in rows:
+            if self.ttl > 0 and now - created_at > self.ttl:
+                continue
+            try:
+                articles[pmid] = json.loads(payload)
+            except json.JSONDecodeError:
+                continue
+
+        with self._lock:
+            self.hits += len(articles)
+            self.misses += len(pmids) - len(articles)
+        return articles
+
+    def set_articles(self, articles: Dict[str, Dict[str, Any]]):
+        """
+        批量写入文章详情
+
+        Args:
+            articles: PMID -> 文章信息
+        """
+        if not articles:
+            return
+
+        now = time.time()
+        rows = [
+            (pmid, json.dumps(article, ensure_ascii=False), now)
+            for pmid, article in articles.items()
+        ]
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO articles (pmid, payload, created_at) VALUES (?, ?, ?)",
+                rows
+            )
+            self._conn.commit()
+
+    def log_stats(self):
+        """输出缓存命中统计"""
+        total = self.hits + self.misses
+        if total:
+            logger.info(f"💾 PubMed缓存: 命中 {self.hits}/{total} 篇 ({self.hits / total:.0%})")
+
+    def close(self):
+        """关闭数据库连接"""
+        with self._lock:
+            self._conn.close()
@@ -3,19 +3,53 @@
 文章搜索和过滤模块
 """
 
+import functools
+import io
 import json
 import logging
+import queue
 import re
+import sys
+import threading
+import time
 import yaml
 import requests
-import feedparser
-from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from requests.adapters import HTTPAdapter
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from itertools import chain
+from typing import Callable, Dict, Iterable, Iterator, List, Any, Optional, Tuple, Union
 from pathlib import Path
 from dateutil import parser as date_parser
 
-from .ai_filter import filter_articles_with_ai
+# orjson为可选依赖，未安装时使用标准库json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# lxml为可选依赖，未安装时使用标准库ElementTree，两者的iterparse和find接口一致
+try:
+    from lxml import etree as ET
+    # lxml默认会展开XML实体，解析外部返回的内容时关闭实体展开和网络访问
+    _XML_PARSER_KWARGS = {"resolve_entities": False, "no_network": True}
+except ImportError:
+    import xml.etree.ElementTree as ET
+    _XML_PARSER_KWARGS = {}
+
+# requests-cache为可选依赖，安装后对PubMed和BioRxiv的HTTP响应进行缓存
+try:
+    from requests_cache import CachedSession
+except ImportError:
+    CachedSession = None
+
+from .ai_filter import filter_articles_with_ai, load_ai_filter
+from .author_match import normalize_author, author_names_match
 from .feishu_pusher import push_to_feishu
+from .pubmed_cache import PubMedCache, DEFAULT_ARTICLE_TTL, DEFAULT_QUERY_TTL
+from .rate_limit import TokenBucket
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +58,175 @@ PUBMED_BASE_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/"
 ESEARCH_URL = PUBMED_BASE_URL + "esearch.fcgi"
 EFETCH_URL = PUBMED_BASE_URL + "efetch.fcgi"
 
+# NCBI限制每秒请求数：无API key时3次，有API key时10次
+PUBMED_RATE_LIMIT = 3
+PUBMED_RATE_LIMIT_WITH_KEY = 10
+
+# 并发搜索的最大期刊数
+_MAX_SEARCH_WORKERS = 8
+
+# 单次efetch请求的最大PMID数（NCBI建议每次不超过200个）
+_EFETCH_BATCH_SIZE = 200
+
+# 并发获取的最大BioRxiv学科数，以及被限流时的最大重试次数
+_MAX_BIORXIV_WORKERS = 4
+_BIORXIV_MAX_RETRIES = 3
+
+# HTTP响应缓存默认有效期：1小时
+DEFAULT_HTTP_CACHE_TTL = 3600
+
+# 配置中的变量引用，如 ${secrets.ai.kimi.api_key}
+_VAR_REF_RE = re.compile(r'\$\{([^}]+)\}\Z')
+
+# BioRxiv作者字符串中的 "LastName, FirstName" 片段
+_AUTHOR_RE = re.compile(r'([^,]+),\s*([^,]+?)(?:\.|,|$)')
+
+
+# RSS 1.0（BioRxiv使用的格式）及其扩展的命名空间
+_RSS_NS = {
+    "rss": "http://purl.org/rss/1.0/",
+    "dc": "http://purl.org/dc/elements/1.1/",
+    "prism": "http://prismstandard.org/namespaces/basic/2.0/",
+}
+
+# RSS条目字段与子元素的对应关系，依次尝试 RSS 1.0 和 RSS 2.0 的元素名
+_RSS_FIELDS = {
+    'title': ("rss:title", "title"),
+    'link': ("rss:link", "link"),
+    'summary': ("rss:description", "description"),
+    'author': ("dc:creator", "author"),
+    'published': ("pubDate",),
+    'updated': ("dc:date",),
+    'prism_publicationdate': ("prism:publicationDate",),
+}
+
+
+def _parse_rss_items(content: bytes) -> List[Dict[str, str]]:
+    """
+    解析RSS内容，提取各条目的字段
+
+    直接按固定元素名读取，不做feedparser的格式探测和HTML清洗；
+    使用lxml解析时不展开XML实体
+
+    Args:
+        content: RSS原始内容
+
+    Returns:
+        List[Dict[str, str]]: 条目列表，只包含存在的字段，字段值已去除首尾空白
+    """
+    root = ET.fromstring(content, ET.XMLParser(**_XML_PARSER_KWARGS))
+    items = root.findall("rss:item", _RSS_NS) or root.findall("channel/item")
+
+    entries = []
+    for item in items:
+        entry = {}
+        for field, paths in _RSS_FIELDS.items():
+            for path in paths:
+                text = item.findtext(path, namespaces=_RSS_NS)
+                if text:
+                    entry[field] = text.strip()
+                    break
+        entries.append(entry)
+    return entries
+
+
+def _parse_feed_date(value: str) -> Optional[datetime]:
+    """
+    解析RSS中的日期字符串
+
+    依次尝试ISO 8601（BioRxiv的dc:date）、RFC 822（RSS 2.0的pubDate）两种常见格式，
+    都不匹配时才使用通用但较慢的dateutil解析
+
+    Args:
+        value: 日期字符串
+
+    Returns:
+        Optional[datetime]: 解析结果，无法解析时返回None
+    """
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        pass
+    try:
+        return parsedate_to_datetime(value)
+    except (ValueError, TypeError, IndexError):
+        pass
+    try:
+        return date_parser.parse(value)
+    except (ValueError, TypeError, OverflowError):
+        return None
+
+
+def _search_text(title: Optional[str], abstract: Optional[str]) -> str:
+    """
+    生成用于关键词检索的小写文本
+
+    Args:
+        title: 文章标题
+        abstract: 文章摘要
+
+    Returns:
+        str: 小写的 "标题 摘要"
+    """
+    return f"{title or ''} {abstract or ''}".lower()
+
+
+def _intern(value: Any) -> Any:
+    """对字符串进行驻留，其他类型原样返回"""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _make_article(title: Optional[str], abstract: Optional[str], authors: List[str],
+                  journal: Optional[str], published: str, link: str, source: str,
+                  doi: Optional[str] = None, pmid: Optional[str] = None) -> Dict[str, Any]:
+    """
+    构建文章字典，PubMed和BioRxiv的文章使用相同的字段顺序
+
+    期刊、来源和作者名在大量文章间重复出现，使用驻留字符串共享同一个对象
+
+    Args:
+        title: 文章标题
+        abstract: 文章摘要
+        authors: 作者列表
+        journal: 期刊名称
+        published: 发表日期
+        link: 文章链接
+        source: 文章来源
+        doi: DOI，为None时不包含该字段
+        pmid: PubMed ID，为None时不包含该字段
+
+    Returns:
+        Dict[str, Any]: 文章信息
+    """
+    article: Dict[str, Any] = {}
+    if pmid is not None:
+        article['pmid'] = pmid
+    article['title'] = title
+    article['abstract'] = abstract
+    article['_search_text'] = _search_text(title, abstract)
+    article['authors'] = [_intern(author) for author in authors]
+    article['journal'] = _intern(journal)
+    if doi is not None:
+        article['doi'] = doi
+    article['published'] = published
+    article['link'] = link
+    article['source'] = _intern(source)
+    return article
+
+
+@functools.lru_cache(maxsize=32)
+def _normalize_keywords(keywords: Tuple[str, ...]) -> Tuple[str, ...]:
+    """
+    将关键词转换为小写并去重
+
+    Args:
+        keywords: 关键词元组
+
+    Returns:
+        Tuple[str, ...]: 按原顺序排列的小写关键词
+    """
+    return tuple(dict.fromkeys(kw.lower() for kw in keywords))
+
 
 class ArticleSearcher:
     """
@@ -33,16 +236,64 @@ class ArticleSearcher:
     """
 
     def __init__(self, config_file: str = "article_search_config.yaml",
-                 secrets_file: str = "secrets.yaml"):
+                 secrets_file: str = "secrets.yaml", refresh: bool = False):
         """
         初始化文章搜索器
 
         Args:
             config_file: 主配置文件路径
             secrets_file: 敏感信息配置文件路径
+            refresh: 是否忽略PubMed缓存和HTTP缓存，重新检索并获取所有文章
         """
         self.config = self._load_config(config_file, secrets_file)
         self._setup_logging()
+        search_config = self.config.get("search_config", {})
+
+        # 所有期刊共用一个HTTP会话，复用连接避免重复进行TCP和TLS握手
+        self._session = self._create_session(search_config, refresh)
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+        # 多个期刊并发搜索时，由令牌桶统一控制对NCBI的请求频率
+        self._ncbi_api_key = self.config.get("search_config", {}).get("ncbi_api_key")
+        rate = PUBMED_RATE_LIMIT_WITH_KEY if self._ncbi_api_key else PUBMED_RATE_LIMIT
+        self._pubmed_rate_limiter = TokenBucket(rate, rate)
+
+        # PubMed检索结果和文章详情缓存，refresh为True时不读取缓存，只写入最新结果
+        self.refresh = refresh
+        self._pubmed_cache = None
+        if search_config.get("pubmed_cache_enabled", True):
+            self._pubmed_cache = PubMedCache(
+                search_config.get("pubmed_cache_path", ".pubmed_cache.sqlite"),
+                search_config.get("pubmed_cache_ttl", DEFAULT_ARTICLE_TTL),
+                search_config.get("pubmed_query_cache_ttl", DEFAULT_QUERY_TTL)
+            )
+
+    @staticmethod
+    def _create_session(search_config: Dict[str, Any], refresh: bool = False) -> requests.Session:
+        """
+        创建HTTP会话
+
+        安装了requests-cache时使用带缓存的会话：缓存有效期内的请求直接读取本地响应，
+        过期后携带 ETag/Last-Modified 重新验证，服务器返回304时复用缓存内容
+
+        Args:
+            search_config: 搜索配置
+            refresh: 是否忽略缓存
+
+        Returns:
+            requests.Session: HTTP会话
+        """
+        if CachedSession is None or refresh or not search_config.get("http_cache_enabled", True):
+            return requests.Session()
+
+        return CachedSession(
+            search_config.get("http_cache_path", ".http_cache"),
+            backend="sqlite",
+            expire_after=search_config.get("http_cache_ttl", DEFAULT_HTTP_CACHE_TTL),
+            stale_if_error=True
+        )
 
     def _load_config(self, config_file: str, secrets_file: str) -> Dict[str, Any]:
         """加载配置文件"""
@@ -75,33 +326,68 @@ class ArticleSearcher:
 
     def _merge_configs(self, main_config: Dict, secrets_config: Dict) -> Dict:
         """合并主配置和敏感信息配置"""
-        import copy
-        merged = copy.deepcopy(main_config)
-        merged['secrets'] = secrets_config
-        return merged
+        # 主配置是新加载的，可直接浅合并，变量引用在合并后的配置上原地解析
+        return {**main_config, 'secrets': secrets_config}
 
     def _resolve_variable_references(self, config: Any, root_config: Dict, max_depth: int = 10) -> Any:
-        """解析配置中的变量引用"""
+        """
+        解析配置中的变量引用
+
+        使用显式栈遍历配置树，只替换形如 ${a.b.c} 的字符串，直接修改所在的字典或列表
+
+        Args:
+            config: 待解析的配置
+            root_config: 变量引用查找的根配置
+            max_depth: 最大嵌套深度
+
+        Returns:
+            Any: 解析后的配置
+        """
         if max_depth <= 0:
             raise ValueError("配置变量引用深度过大，可能存在循环引用")
+        if isinstance(config, str):
+            return self._resolve_reference(config, root_config)
+
+        stack = [(config, max_depth)]
+        while stack:
+            container, depth = stack.pop()
+            if isinstance(container, dict):
+                items = container.items()
+            elif isinstance(container, list):
+                items = enumerate(container)
+            else:
+                continue
 
-        if isinstance(config, dict):
-            resolved = {}
-            for key, value in config.items():
-                resolved[key] = self._resolve_variable_references(value, root_config, max_depth - 1)
-            return resolved
-        elif isinstance(config, list):
-            return [self._resolve_variable_references(item, root_config, max_depth - 1) for item in config]
-        elif isinstance(config, str) and config.startswith("${") and config.endswith("}"):
-            # 解析变量引用
-            var_path = config[2:-1]
-            try:
-                return self._get_nested_value(root_config, var_path)
-            except KeyError:
-                logger.warning(f"⚠️ 无法解析变量引用: {config}，保留原值")
-                return config
-        else:
-            return config
+            child_depth = depth - 1
+            for key, value in list(items):
+                if child_depth <= 0:
+                    raise ValueError("配置变量引用深度过大，可能存在循环引用")
+                if isinstance(value, (dict, list)):
+                    stack.append((value, child_depth))
+                elif isinstance(value, str) and _VAR_REF_RE.match(value):
+                    container[key] = self._resolve_reference(value, root_config)
+
+        return config
+
+    def _resolve_reference(self, value: str, root_config: Dict) -> Any:
+        """
+        解析单个变量引用字符串
+
+        Args:
+            value: 配置字符串
+            root_config: 变量引用查找的根配置
+
+        Returns:
+            Any: 引用的值；不是变量引用或无法解析时返回原字符串
+        """
+        match = _VAR_REF_RE.match(value)
+        if match is None:
+            return value
+        try:
+            return self._get_nested_value(root_config, match.group(1))
+        except KeyError:
+            logger.warning(f"⚠️ 无法解析变量引用: {value}，保留原值")
+            return value
 
     def _get_nested_value(self, config: Dict, path: str) -> Any:
         """从嵌套字典中获取值"""
@@ -152,17 +438,25 @@ class ArticleSearcher:
             format='%(asctime)s - %(levelname)s - %(message)s'
         )
 
-    def search_articles(self, days: int = 7, max_results_per_journal: int = 20) -> Dict[str, List[Dict]]:
+    def _max_results_per_journal(self) -> int:
+        """获取配置中每个期刊的最大结果数，串行搜索和流水线共用"""
+        return self.config.get("search_config", {}).get("max_results_per_journal", 20)
+
+    def search_articles(self, days: int = 7,
+                        max_results_per_journal: Optional[int] = None) -> Dict[str, List[Dict]]:
         """
         搜索文章
 
         Args:
             days: 搜索最近几天
-            max_results_per_journal: 每个期刊最大结果数
+            max_results_per_journal: 每个期刊最大结果数，默认使用 search_config.max_results_per_journal
 
         Returns:
             Dict[str, List[Dict]]: 各期刊的文章列表
         """
+        if max_results_per_journal is None:
+            max_results_per_journal = self._max_results_per_journal()
+
         # 获取期刊列表
         journals = self.config["journals"]["pubmed_journals"].copy()
         if self.config["journals"]["biorxiv"]["enabled"]:
@@ -188,33 +482,151 @@ class ArticleSearcher:
                         max_results_per_journal: int, biorxiv_subjects: List[str],
                         author_config: Dict) -> Dict[str, List[Dict]]:
         """从指定期刊搜索文章"""
-        results = {}
+        found = dict(self._iter_journal_searches(journals, keywords, days, max_results_per_journal,
+                                                 biorxiv_subjects, author_config))
+        # 按配置中的期刊顺序返回
+        return {journal: found[journal] for journal in journals}
+
+    def _iter_journal_searches(self, journals: List[str], keywords: List[str], days: int,
+                               max_results_per_journal: int, biorxiv_subjects: List[str],
+                               author_config: Dict) -> Iterator[Tuple[str, List[Dict]]]:
+        """
+        并发搜索多个期刊
+
+        Args:
+            journals: 期刊列表
+            keywords: 关键词列表
+            days: 搜索最近几天
+            max_results_per_journal: 每个期刊最大结果数
+            biorxiv_subjects: BioRxiv学科列表
+            author_config: 作者过滤配置
+
+        Yields:
+            Tuple[str, List[Dict]]: 按完成顺序返回期刊名称及其文章列表
+        """
+        # PubMed期刊合并为一次批量搜索，其余来源（BioRxiv）单独搜索
+        pubmed_journals = [journal for journal in journals if journal.lower() != "biorxiv"]
+        other_journals = [journal for journal in journals if journal.lower() == "biorxiv"]
+
+        with ThreadPoolExecutor(max_workers=max(1, len(other_journals) + 1)) as executor:
+            futures = {
+                executor.submit(self._search_journal, journal, keywords, days, max_results_per_journal,
+                                biorxiv_subjects, author_config): journal
+                for journal in other_journals
+            }
+            if pubmed_journals:
+                futures[executor.submit(self._batch_pubmed_search, pubmed_journals, keywords, days,
+                                        max_results_per_journal)] = None
+
+            for future in as_completed(futures):
+                journal = futures[future]
+                if journal is not None:
+                    yield journal, future.result()
+                    continue
+                for journal, articles in future.result().items():
+                    articles = self._filter_pubmed_by_authors(articles, author_config)
+                    logger.info(f"{journal}: 找到 {len(articles)} 篇文章")
+                    yield journal, articles
+
+        if self._pubmed_cache is not None:
+            self._pubmed_cache.log_stats()
+
+    def _search_journal(self, journal: str, keywords: List[str], days: int,
+                       max_results_per_journal: int, biorxiv_subjects: List[str],
+                       author_config: Dict) -> List[Dict]:
+        """从单个期刊搜索文章"""
+        journal_lower = journal.lower()
+
+        logger.info(f"搜索期刊: {journal}")
+
+        if journal_lower == "biorxiv":
+            articles = self._search_biorxiv(biorxiv_subjects, keywords, days, max_results_per_journal)
+            # 对BioRxiv文章进行作者过滤
+            articles = self._filter_by_authors(articles, author_config, source="biorxiv")
+        else:
+            # 直接使用期刊名称加上[Journal]后缀作为PubMed查询
+            journal_query = f"{journal}[Journal]"
+            articles = self._search_pubmed_journal(journal_query, keywords, days, max_results_per_journal)
+            articles = self._filter_pubmed_by_authors(articles, author_config)
+
+        logger.info(f"{journal}: 找到 {len(articles)} 篇文章")
+        return articles
+
+    def _filter_pubmed_by_authors(self, articles: List[Dict], author_config: Dict) -> List[Dict]:
+        """PubMed文章根据模式决定是否进行作者过滤"""
+        if author_config.get("mode") == "all":
+            return self._filter_by_authors(articles, author_config, source="pubmed")
+        return articles
 
-        for journal in journals:
-            journal_lower = journal.lower()
+    def _batch_pubmed_search(self, journals: List[str], keywords: List[str],
+                             days: int, max_results: int) -> Dict[str, List[Dict]]:
+        """
+        批量搜索多个PubMed期刊
+
+        先并发检索各期刊的PMID，合并去重后统一获取文章详情，
+        同一篇文章出现在多个期刊的检索结果中时只获取和解析一次
+
+        Args:
+            journals: PubMed期刊列表
+            keywords: 关键词列表
+            days: 搜索最近几天
+            max_results: 每个期刊最大结果数
 
+        Returns:
+            Dict[str, List[Dict]]: 各期刊的文章列表，按检索结果的顺序排列
+        """
+        def esearch(journal: str) -> List[str]:
             logger.info(f"搜索期刊: {journal}")
+            try:
+                return self._pubmed_esearch(f"{journal}[Journal]", keywords, days, max_results)
+            except Exception as e:
+                logger.error(f"搜索PubMed失败: {e}")
+                return []
 
-            if journal_lower == "biorxiv":
-                articles = self._search_biorxiv(biorxiv_subjects, keywords, days, max_results_per_journal)
-                # 对BioRxiv文章进行作者过滤
-                articles = self._filter_by_authors(articles, author_config, source="biorxiv")
-            else:
-                # 直接使用期刊名称加上[Journal]后缀作为PubMed查询
-                journal_query = f"{journal}[Journal]"
-                articles = self._search_pubmed_journal(journal_query, keywords, days, max_results_per_journal)
-                # PubMed文章根据模式决定是否进行作者过滤
-                if author_config.get("mode") == "all":
-                    articles = self._filter_by_authors(articles, author_config, source="pubmed")
+        with ThreadPoolExecutor(max_workers=max(1, min(_MAX_SEARCH_WORKERS, len(journals)))) as executor:
+            pmids_by_journal = dict(zip(journals, executor.map(esearch, journals)))
 
-            results[journal] = articles
-            logger.info(f"{journal}: 找到 {len(articles)} 篇文章")
+        # 合并各期刊的PMID，保持首次出现的顺序
+        all_pmids = list(dict.fromkeys(chain.from_iterable(pmids_by_journal.values())))
+        try:
+            articles_by_pmid = self._fetch_pubmed_articles(all_pmids)
+        except Exception as e:
+            logger.error(f"获取PubMed文章详情失败: {e}")
+            articles_by_pmid = {}
 
-        return results
+        return {
+            journal: [articles_by_pmid[pmid] for pmid in pmids if pmid in articles_by_pmid][:max_results]
+            for journal, pmids in pmids_by_journal.items()
+        }
 
     def _search_pubmed_journal(self, journal_query: str, keywords: List[str],
                               days: int, max_results: int) -> List[Dict]:
         """从PubMed指定期刊搜索文章"""
+        try:
+            pmids = self._pubmed_esearch(journal_query, keywords, days, max_results)
+            articles_by_pmid = self._fetch_pubmed_articles(pmids)
+        except Exception as e:
+            logger.error(f"搜索PubMed失败: {e}")
+            return []
+
+        # 按检索结果的顺序返回
+        articles = [articles_by_pmid[pmid] for pmid in pmids if pmid in articles_by_pmid]
+        return articles[:max_results]
+
+    def _pubmed_esearch(self, journal_query: str, keywords: List[str],
+                        days: int, max_results: int) -> List[str]:
+        """
+        检索PubMed指定期刊的文章，返回PMID列表
+
+        Args:
+            journal_query: 期刊查询，如 "Nature[Journal]"
+            keywords: 关键词列表
+            days: 搜索最近几天
+            max_results: 最大结果数
+
+        Returns:
+            List[str]: 按相关性排序的PMID列表
+        """
         # 计算日期范围
         end_date = datetime.now()
         start_date = end_date - timedelta(days=days)
@@ -228,7 +640,6 @@ class ArticleSearcher:
 
         query = " AND ".join(f"({part})" for part in query_parts)
 
-        # 搜索
         search_params = {
             "db": "pubmed",
             "term": query,
@@ -237,125 +648,199 @@ class ArticleSearcher:
             "sort": "relevance"
         }
 
-        try:
-            response = requests.get(ESEARCH_URL, params=search_params, timeout=30)
-            response.raise_for_status()
-            search_results = response.json()
+        # 缓存键包含全部请求参数，不同 retmax 的检索结果不会互相复用
+        cache = self._pubmed_cache
+        if cache is not None and not self.refresh:
+            pmids = cache.get_query(search_params)
+            if pmids is not None:
+                return pmids
 
-            pmids = search_results["esearchresult"]["idlist"]
-            if not pmids:
-                return []
+        # 搜索
+        response = self._pubmed_get(ESEARCH_URL, search_params)
+        response.raise_for_status()
+        pmids = response.json()["esearchresult"]["idlist"]
+
+        if cache is not None:
+            cache.set_query(search_params, pmids)
+        return pmids
+
+    def _fetch_pubmed_articles(self, pmids: List[str]) -> Dict[str, Dict]:
+        """
+        获取文章详情，只请求缓存中没有的文章，每次efetch最多 _EFETCH_BATCH_SIZE 篇
+
+        Args:
+            pmids: PMID列表
+
+        Returns:
+            Dict[str, Dict]: PMID -> 文章信息，获取失败的文章不包含在内
+        """
+        if not pmids:
+            return {}
 
-            # 获取文章详情
+        cache = self._pubmed_cache
+        articles_by_pmid = cache.get_articles(pmids) if cache is not None and not self.refresh else {}
+        missing = [pmid for pmid in pmids if pmid not in articles_by_pmid]
+
+        for start in range(0, len(missing), _EFETCH_BATCH_SIZE):
             fetch_params = {
                 "db": "pubmed",
-                "id": ",".join(pmids),
+                "id": ",".join(missing[start:start + _EFETCH_BATCH_SIZE]),
                 "retmode": "xml"
             }
 
-            fetch_response = requests.get(EFETCH_URL, params=fetch_params, timeout=30)
-            fetch_response.raise_for_status()
+            # 单批请求或解析失败只丢失这一批文章，不影响其他批次
+            try:
+                fetch_response = self._pubmed_get(EFETCH_URL, fetch_params)
+                fetch_response.raise_for_status()
 
-            # 解析XML结果
-            articles = self._parse_pubmed_xml(fetch_response.text)
-            return articles[:max_results]
+                # 解析XML结果
+                fetched = {
+                    article['pmid']: article
+                    for article in self._parse_pubmed_xml(fetch_response.content)
+                }
+            except Exception as e:
+                logger.error(f"获取PubMed文章详情失败: {e}")
+                continue
 
-        except Exception as e:
-            logger.error(f"搜索PubMed失败: {e}")
-            return []
+            if cache is not None:
+                try:
+                    cache.set_articles(fetched)
+                except Exception as e:
+                    logger.warning(f"⚠️ 写入PubMed缓存失败: {e}")
+            articles_by_pmid.update(fetched)
+
+        return articles_by_pmid
+
+    def _pubmed_get(self, url: str, params: Dict[str, Any]) -> requests.Response:
+        """
+        请求NCBI E-utilities接口，遵守NCBI的请求频率限制
+
+        Args:
+            url: 接口地址
+            params: 请求参数
+
+        Returns:
+            requests.Response: 响应对象
+        """
+        if self._ncbi_api_key:
+            params = {**params, "api_key": self._ncbi_api_key}
+        self._pubmed_rate_limiter.acquire()
+        return self._session.get(url, params=params, timeout=30)
+
+    def _parse_pubmed_xml(self, xml_content: Union[str, bytes]) -> List[Dict]:
+        """
+        解析PubMed XML结果
 
-    def _parse_pubmed_xml(self, xml_content: str) -> List[Dict]:
-        """解析PubMed XML结果"""
-        import xml.etree.ElementTree as ET
+        以流式方式解析，每篇文章解析完成后立即释放其元素，
+        各字段按固定路径直接查找，不在整篇文章的子树中搜索；
+        安装了lxml时使用lxml解析，且不展开XML实体
+        """
+        if isinstance(xml_content, str):
+            xml_content = xml_content.encode('utf-8')
 
         articles = []
-        root = ET.fromstring(xml_content)
+        root = None
 
-        for article in root.findall(".//PubmedArticle"):
-            try:
-                # 提取标题
-                title_elem = article.find(".//ArticleTitle")
-                title = title_elem.text if title_elem is not None else "No title"
-
-                # 提取摘要
-                abstract_elem = article.find(".//AbstractText")
-                abstract = abstract_elem.text if abstract_elem is not None else ""
-
-                # 提取作者
-                authors = []
-                for author_elem in article.findall(".//Author"):
-                    last_name = author_elem.find("LastName")
-                    fore_name = author_elem.find("ForeName")
-                    if last_name is not None and fore_name is not None:
-                        # PubMed格式: "LastName, ForeName"
-                        # 转换为更常见的 "ForeName LastName" 格式
-                        authors.append(f"{fore_name.text} {last_name.text}")
-                    elif last_name is not None:
-                        authors.append(last_name.text)
-
-                # 提取期刊信息
-                journal_elem = article.find(".//Journal/Title")
-                journal = journal_elem.text if journal_elem is not None else "Unknown"
-
-                # 提取DOI
-                doi_elem = article.find(".//ELocationID[@EIdType='doi']")
-                doi = doi_elem.text if doi_elem is not None else ""
-
-                # 提取发表日期
-                pub_date_elem = article.find(".//PubDate")
-                published = "Unknown"
-                if pub_date_elem is not None:
-                    year = pub_date_elem.find("Year")
-                    month = pub_date_elem.find("Month")
-                    day = pub_date_elem.find("Day")
-                    if year is not None:
-                        date_str = year.text
-                        if month is not None:
-                            date_str += f"-{month.text.zfill(2)}"
-                            if day is not None:
-                                date_str += f"-{day.text.zfill(2)}"
-                        try:
-                            published = datetime.strptime(date_str, "%Y-%m-%d").isoformat()
-                        except:
-                            published = date_str
-
-                articles.append({
-                    'title': title,
-                    'abstract': abstract,
-                    'authors': authors,
-                    'journal': journal,
-                    'doi': doi,
-                    'published': published,
-                    'link': f"https://doi.org/{doi}" if doi else "",
-                    'source': 'PubMed'
-                })
+        for event, elem in ET.iterparse(io.BytesIO(xml_content), events=("start", "end"),
+                                        **_XML_PARSER_KWARGS):
+            if root is None:
+                root = elem
+            if event != "end" or elem.tag != "PubmedArticle":
+                continue
 
+            try:
+                articles.append(self._parse_pubmed_article(elem))
             except Exception as e:
                 logger.error(f"解析PubMed文章失败: {e}")
-                continue
+            finally:
+                # 释放已解析的文章元素
+                root.clear()
 
         return articles
 
+    def _parse_pubmed_article(self, article) -> Dict:
+        """
+        解析单篇PubMed文章
+
+        Args:
+            article: PubmedArticle元素
+
+        Returns:
+            Dict: 文章信息
+        """
+        pmid_elem = article.find("MedlineCitation/PMID")
+        medline_article = article.find("MedlineCitation/Article")
+        if medline_article is None:
+            raise ValueError("缺少 MedlineCitation/Article 元素")
+
+        # 提取标题
+        title_elem = medline_article.find("ArticleTitle")
+        title = title_elem.text if title_elem is not None else "No title"
+
+        # 提取摘要
+        abstract_elem = medline_article.find("Abstract/AbstractText")
+        abstract = abstract_elem.text if abstract_elem is not None else ""
+
+        # 提取作者
+        authors = []
+        for author_elem in medline_article.iterfind("AuthorList/Author"):
+            last_name = author_elem.find("LastName")
+            fore_name = author_elem.find("ForeName")
+            if last_name is not None and fore_name is not None:
+                # PubMed格式: "LastName, ForeName"
+                # 转换为更常见的 "ForeName LastName" 格式
+                authors.append(f"{fore_name.text} {last_name.text}")
+            elif last_name is not None:
+                authors.append(last_name.text)
+
+        # 提取期刊信息
+        journal_elem = medline_article.find("Journal/Title")
+        journal = journal_elem.text if journal_elem is not None else "Unknown"
+
+        # 提取DOI
+        doi_elem = medline_article.find("ELocationID[@EIdType='doi']")
+        if doi_elem is None:
+            doi_elem = article.find("PubmedData/ArticleIdList/ArticleId[@IdType='doi']")
+        doi = doi_elem.text if doi_elem is not None else ""
+
+        # 提取发表日期
+        pub_date_elem = medline_article.find("Journal/JournalIssue/PubDate")
+        published = "Unknown"
+        if pub_date_elem is not None:
+            year = pub_date_elem.find("Year")
+            month = pub_date_elem.find("Month")
+            day = pub_date_elem.find("Day")
+            if year is not None:
+                date_str = year.text
+                if month is not None:
+                    date_str += f"-{month.text.zfill(2)}"
+                    if day is not None:
+                        date_str += f"-{day.text.zfill(2)}"
+                try:
+                    published = datetime.strptime(date_str, "%Y-%m-%d").isoformat()
+                except:
+                    published = date_str
+
+        return _make_article(
+            title, abstract, authors, journal, published,
+            link=f"https://doi.org/{doi}" if doi else "",
+            source='PubMed',
+            doi=doi,
+            pmid=pmid_elem.text if pmid_elem is not None else ""
+        )
+
     def _search_biorxiv(self, subjects: List[str], keywords: List[str],
                        days: int, max_results: int) -> List[Dict]:
         """从BioRxiv搜索文章"""
         all_articles = []
 
-        for subject in subjects:
-            logger.info(f"获取RSS: https://connect.biorxiv.org/biorxiv_xml.php?subject={subject}")
-
-            try:
-                # 计算日期范围
-                end_date = datetime.now()
-                start_date = end_date - timedelta(days=days)
-
-                # 构建RSS URL
-                rss_url = f"https://connect.biorxiv.org/biorxiv_xml.php?subject={subject}"
+        # 计算起始时间戳（UTC），循环内只比较数字，避免带时区与不带时区的日期无法比较
+        start_ts = (datetime.now(timezone.utc) - timedelta(days=days)).timestamp()
 
-                # 解析RSS
-                feed = feedparser.parse(rss_url)
-
-                for entry in feed.entries:
+        # 并发获取各学科的RSS，按学科顺序处理结果
+        with ThreadPoolExecutor(max_workers=max(1, min(_MAX_BIORXIV_WORKERS, len(subjects)))) as executor:
+            for entries in executor.map(self._fetch_biorxiv_subject, subjects):
+                for entry in entries:
                     try:
                         # 解析发表日期 - BioRxiv可能使用不同的日期字段
                         published_str = entry.get('published', '') or entry.get('updated', '') or entry.get('prism_publicationdate', '')
@@ -365,36 +850,30 @@ class ArticleSearcher:
                             continue
                         
                         # 尝试解析日期
-                        try:
-                            published_dt = date_parser.parse(published_str)
-                        except (ValueError, TypeError):
-                            # 如果日期解析失败，尝试从其他字段获取
-                            if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                                import time
-                                published_dt = datetime(*entry.published_parsed[:6])
-                            elif hasattr(entry, 'updated_parsed') and entry.updated_parsed:
-                                import time
-                                published_dt = datetime(*entry.updated_parsed[:6])
-                            else:
-                                # 无法解析日期，跳过
-                                continue
+                        published_dt = _parse_feed_date(published_str)
+                        if published_dt is None:
+                            # 无法解析日期，跳过
+                            continue
                         
-                        if published_dt < start_date:
+                        # 不带时区的日期按UTC处理
+                        if published_dt.tzinfo is None:
+                            published_ts = published_dt.replace(tzinfo=timezone.utc).timestamp()
+                        else:
+                            published_ts = published_dt.timestamp()
+                        if published_ts < start_ts:
                             continue
 
                         # 解析作者
                         author_str = entry.get('author', '')
                         authors = self._parse_biorxiv_authors(author_str)
 
-                        article = {
-                            'title': entry.get('title', ''),
-                            'abstract': entry.get('summary', ''),
-                            'authors': authors,
-                            'journal': 'BioRxiv',
-                            'published': published_dt.isoformat(),
-                            'link': entry.get('link', ''),
-                            'source': 'BioRxiv',
-                        }
+                        title = entry.get('title', '')
+                        abstract = entry.get('summary', '')
+                        article = _make_article(
+                            title, abstract, authors, 'BioRxiv', published_dt.isoformat(),
+                            link=entry.get('link', ''),
+                            source='BioRxiv'
+                        )
 
                         all_articles.append(article)
 
@@ -402,18 +881,42 @@ class ArticleSearcher:
                         # 静默跳过解析失败的条目，避免大量错误日志
                         continue
 
-                # 避免请求过于频繁
-                import time
-                time.sleep(1)
-
-            except Exception as e:
-                logger.error(f"获取RSS失败: {e}")
-                continue
-
         # 关键词过滤
         filtered = self._filter_by_keywords(all_articles, keywords)
         return filtered[:max_results]
 
+    def _fetch_biorxiv_subject(self, subject: str) -> List[Dict[str, str]]:
+        """
+        获取BioRxiv单个学科的RSS条目
+
+        不再在请求之间固定等待，仅在被限流（HTTP 429）时按 Retry-After 等待后重试
+
+        Args:
+            subject: 学科名称
+
+        Returns:
+            List[Dict[str, str]]: RSS条目列表，获取失败时返回空列表
+        """
+        rss_url = f"https://connect.biorxiv.org/biorxiv_xml.php?subject={subject}"
+        logger.info(f"获取RSS: {rss_url}")
+
+        try:
+            for attempt in range(_BIORXIV_MAX_RETRIES + 1):
+                response = self._session.get(rss_url, timeout=30)
+                if response.status_code != 429 or attempt == _BIORXIV_MAX_RETRIES:
+                    break
+                retry_after = response.headers.get("Retry-After", "")
+                delay = float(retry_after) if retry_after.isdigit() else 2 ** attempt
+                logger.warning(f"⚠️ BioRxiv请求被限流，{delay:.0f} 秒后重试: {subject}")
+                time.sleep(delay)
+            response.raise_for_status()
+
+            # 解析RSS
+            return _parse_rss_items(response.content)
+        except Exception as e:
+            logger.error(f"获取RSS失败: {e}")
+            return []
+
     def _parse_biorxiv_authors(self, author_str: str) -> List[str]:
         """
         解析BioRxiv作者字符串，保留完整的作者名字
@@ -431,8 +934,7 @@ class ArticleSearcher:
 
         # BioRxiv格式: "LastName, FirstName/Initials., LastName, FirstName/Initials."
         # 使用正则表达式来正确解析
-        pattern = r'([^,]+),\s*([^,]+?)(?:\.|,|$)'
-        matches = re.findall(pattern, author_str)
+        matches = _AUTHOR_RE.findall(author_str)
 
         authors = []
         for match in matches:
@@ -470,104 +972,42 @@ class ArticleSearcher:
         if not keywords:
             return articles
 
+        # 关键词只需转换一次小写；逐个关键词使用C实现的子串查找，
+        # 比合并为一个多分支正则表达式扫描更快
+        normalized_keywords = _normalize_keywords(tuple(keywords))
+
         filtered = []
         for article in articles:
-            title = article.get('title', '').lower()
-            abstract = article.get('abstract', '').lower()
-            text = title + " " + abstract
+            text = article.get('_search_text')
+            if text is None:
+                text = _search_text(article.get('title', ''), article.get('abstract', ''))
 
-            if any(kw.lower() in text for kw in keywords):
-                filtered.append(article)
+            for kw in normalized_keywords:
+                if kw in text:
+                    filtered.append(article)
+                    break
 
         return filtered
 
-    def _normalize_author_name(self, author_name: str) -> str:
+    @staticmethod
+    def _normalize_author_name(author_name: str) -> str:
         """
-        标准化作者名字，用于匹配
-        
-        将不同格式的名字转换为统一的格式进行比较：
-        - "Fabian Theis" -> "fabian theis"
-        - "Theis, Fabian" -> "fabian theis"
+        标准化作者名字，用于匹配，见 author_match.normalize_author
+
         - "Theis, Fabian J." -> "fabian theis"
         - "Fabian J. Theis" -> "fabian theis"
         """
-        if not author_name:
-            return ""
-        
-        # 转换为小写并移除多余空格
-        normalized = author_name.lower().strip()
-        
-        # 处理 "LastName, FirstName" 格式
-        if ',' in normalized:
-            parts = [p.strip() for p in normalized.split(',')]
-            if len(parts) >= 2:
-                # 交换顺序：LastName, FirstName -> FirstName LastName
-                normalized = f"{parts[1]} {parts[0]}"
-            else:
-                normalized = parts[0]
-        
-        # 移除中间名和缩写（保留姓和名）
-        # 例如 "fabian j. theis" -> "fabian theis"
-        words = normalized.split()
-        if len(words) >= 2:
-            # 保留第一个词（名）和最后一个词（姓）
-            # 移除中间的缩写（如 "j.", "f.", 等）
-            first_name = words[0]
-            last_name = words[-1]
-            # 如果中间有单字母或缩写，忽略它们
-            normalized = f"{first_name} {last_name}"
-        
-        return normalized.strip()
-    
-    def _author_names_match(self, author1: str, author2: str) -> bool:
+        return normalize_author(author_name)
+
+    @staticmethod
+    def _author_names_match(author1: str, author2: str) -> bool:
         """
-        判断两个作者名字是否指向同一个人
-        
-        支持多种格式匹配：
+        判断两个作者名字是否指向同一个人，见 author_match.author_names_match
+
         - "Fabian Theis" 匹配 "Fabian J. Theis"
         - "Theis, Fabian" 匹配 "Fabian Theis"
-        - "Fabian Theis" 匹配 "Theis, Fabian J."
         """
-        if not author1 or not author2:
-            return False
-        
-        # 标准化两个名字
-        norm1 = self._normalize_author_name(author1)
-        norm2 = self._normalize_author_name(author2)
-        
-        # 完全匹配
-        if norm1 == norm2:
-            return True
-        
-        # 部分匹配：检查是否包含对方的姓和名
-        # 例如 "fabian theis" 应该匹配 "fabian j. theis"
-        words1_list = norm1.split()
-        words2_list = norm2.split()
-        
-        # 如果两个名字的姓和名都匹配，认为是同一个人
-        # 至少需要匹配姓（最后一个词）和名（第一个词）
-        if len(words1_list) >= 2 and len(words2_list) >= 2:
-            # 检查姓和名是否都匹配
-            first1 = words1_list[0]
-            last1 = words1_list[-1]
-            first2 = words2_list[0]
-            last2 = words2_list[-1]
-            
-            # 检查姓和名是否匹配
-            if (last1 == last2) and (first1 == first2):
-                return True
-        
-        # 如果标准化后的名字有包含关系，也认为是匹配
-        # 例如 "fabian theis" 包含在 "fabian j. theis" 中
-        if norm1 in norm2 or norm2 in norm1:
-            # 但需要确保至少包含姓
-            words1_list = norm1.split()
-            words2_list = norm2.split()
-            if words1_list and words2_list:
-                if words1_list[-1] == words2_list[-1]:  # 姓匹配
-                    return True
-        
-        return False
+        return author_names_match(author1, author2)
 
     def _filter_by_authors(self, articles: List[Dict], author_config: Dict, source: str = "all") -> List[Dict]:
         """
@@ -586,6 +1026,10 @@ class ArticleSearcher:
         if mode == "biorxiv_only" and source != "biorxiv":
             return articles
 
+        # 包含和排除列表只需标准化并按姓建立索引一次
+        match_include = self._make_author_matcher(include_authors)
+        match_exclude = self._make_author_matcher(exclude_authors)
+
         filtered = []
         for article in articles:
             article_authors = article.get("authors", [])
@@ -596,36 +1040,54 @@ class ArticleSearcher:
                     filtered.append(article)
                 continue
 
+            article_norms = {normalize_author(a) for a in article_authors if a}
+
             # 检查是否包含排除的作者
-            if exclude_authors:
-                excluded = False
-                for excl_author in exclude_authors:
-                    for article_author in article_authors:
-                        if self._author_names_match(excl_author, article_author):
-                            excluded = True
-                            break
-                    if excluded:
-                        break
-                if excluded:
-                    continue
+            if match_exclude(article_norms):
+                continue
 
             # 检查是否包含指定的作者
-            if include_authors:
-                author_match = False
-                for incl_author in include_authors:
-                    for article_author in article_authors:
-                        if self._author_names_match(incl_author, article_author):
-                            author_match = True
-                            break
-                    if author_match:
-                        break
-                if not author_match:
-                    continue
+            if not match_include(article_norms):
+                continue
 
             filtered.append(article)
 
         return filtered
 
+    def _make_author_matcher(self, authors: List[str]) -> Callable[[Iterable[str]], bool]:
+        """
+        为包含或排除的作者列表构建匹配函数，匹配规则与 _author_names_match 相同
+
+        作者按标准化名字建立集合，并按姓分桶，
+        文章的每位作者只需与同姓的候选作者比较，而不必遍历整个列表
+
+        Args:
+            authors: 包含或排除的作者列表
+
+        Returns:
+            Callable: 参数为文章作者标准化后的名字，返回是否有作者与列表中的某位作者匹配
+        """
+        norms = {normalize_author(a) for a in authors if a}
+        by_last_name: Dict[str, List[str]] = defaultdict(list)
+        for norm in norms:
+            if norm:
+                by_last_name[norm.split()[-1]].append(norm)
+
+        def match(article_norms: Iterable[str]) -> bool:
+            for norm in article_norms:
+                # 完全匹配
+                if norm in norms:
+                    return True
+                if not norm:
+                    continue
+                # 姓相同且标准化后的名字有包含关系
+                for other in by_last_name.get(norm.split()[-1], ()):
+                    if norm in other or other in norm:
+                        return True
+            return False
+
+        return match
+
     def filter_with_ai(self, articles: Dict[str, List[Dict]]) -> Dict[str, List[Dict]]:
         """
         使用AI过滤文章
@@ -644,9 +1106,7 @@ class ArticleSearcher:
         logger.info("🤖 开始AI过滤...")
 
         # 收集所有文章
-        all_articles = []
-        for journal_articles in articles.values():
-            all_articles.extend(journal_articles)
+        all_articles = list(chain.from_iterable(articles.values()))
 
         # 应用最大检索上限
         max_articles = ai_config.get("max_articles_for_filtering", 0)
@@ -662,15 +1122,12 @@ class ArticleSearcher:
         filtered_articles = filter_articles_with_ai(all_articles, self.config)
 
         # 重新组织结果按期刊分组
-        filtered_results = {}
+        filtered_results = defaultdict(list)
         for article in filtered_articles:
-            journal = article.get('journal', 'Unknown')
-            if journal not in filtered_results:
-                filtered_results[journal] = []
-            filtered_results[journal].append(article)
+            filtered_results[article.get('journal', 'Unknown')].append(article)
 
-        logger.info(f"✅ AI过滤完成，剩余 {sum(len(articles) for articles in filtered_results.values())} 篇文章")
-        return filtered_results
+        logger.info(f"✅ AI过滤完成，剩余 {len(filtered_articles)} 篇文章")
+        return dict(filtered_results)
 
     def push_to_feishu(self, original_results: Dict[str, List[Dict]],
                       filtered_results: Dict[str, List[Dict]], days: int = 7) -> bool:
@@ -721,9 +1178,23 @@ class ArticleSearcher:
         filename_format = self.config["output"]["filename_format"]
         output_file = filename_format.format(days=days)
 
+        # 去掉仅用于检索的内部字段
+        results = {
+            journal: [
+                {key: value for key, value in article.items() if key != '_search_text'}
+                for article in articles
+            ]
+            for journal, articles in results.items()
+        }
+
         try:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(results, f, ensure_ascii=False, indent=2)
+            if orjson is not None:
+                Path(output_file).write_bytes(
+                    orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str)
+                )
+            else:
+                with open(output_file, 'w', encoding='utf-8') as f:
+                    json.dump(results, f, ensure_ascii=False, indent=2)
             logger.info(f"✅ 结果已保存到 {output_file}")
         except Exception as e:
             logger.error(f"❌ 保存结果失败: {e}")
@@ -753,4 +1224,123 @@ class ArticleSearcher:
         # 保存结果
         self.save_results(filtered_results, days)
 
-        return filtered_results
\ No newline at end of file
+        return filtered_results
+
+    def run_pipeline(self, days: int = 7, push: bool = True) -> Dict[str, List[Dict]]:
+        """
+        以流水线方式运行工作流程：搜索 -> AI过滤 -> 飞书推送
+
+        三个阶段在不同线程中运行并通过队列衔接：每个期刊搜索完成后立即进入AI过滤，
+        过滤后的文章凑满一次推送的数量即推送，不必等待上一阶段全部完成。
+        由于推送时搜索可能尚未结束，推送消息中的统计数据为推送时刻的累计值。
+
+        Args:
+            days: 搜索最近几天
+            push: 是否推送到飞书
+
+        Returns:
+            Dict[str, List[Dict]]: 最终的过滤结果
+        """
+        journals = self.config["journals"]["pubmed_journals"].copy()
+        if self.config["journals"]["biorxiv"]["enabled"]:
+            journals.append("biorxiv")
+        keywords = self.config["keywords"]["any"] + self.config["keywords"]["all"]
+        biorxiv_subjects = self.config["journals"]["biorxiv"]["subjects"]
+        author_config = self.config.get("authors", {})
+        max_results_per_journal = self._max_results_per_journal()
+
+        ai_config = self.config.get("ai_filtering", {})
+        ai_filter = load_ai_filter(self.config) if ai_config.get("enabled", False) else None
+        # 剩余可进行AI过滤的文章数，None表示不限制
+        max_articles = ai_config.get("max_articles_for_filtering", 0)
+        remaining = max_articles if max_articles > 0 else None
+
+        feishu_config = self.config.get("feishu", {})
+        push = push and feishu_config.get("enabled", False)
+        push_batch_size = feishu_config.get("push_config", {}).get("max_articles_per_push", 10)
+
+        # 队列中的 None 表示上游阶段已结束
+        raw_queue = queue.Queue()
+        filtered_queue = queue.Queue()
+        results: Dict[str, List[Dict]] = {}
+        # 搜索线程写入results的同时推送阶段会读取统计数据，需要加锁
+        results_lock = threading.Lock()
+        errors: List[BaseException] = []
+
+        def search_stage():
+            try:
+                logger.info(f"开始搜索最近 {days} 天的文章...")
+                for journal, articles in self._iter_journal_searches(journals, keywords, days,
+                                                                     max_results_per_journal,
+                                                                     biorxiv_subjects, author_config):
+                    with results_lock:
+                        results[journal] = articles
+                    raw_queue.put((journal, articles))
+            except Exception as e:
+                errors.append(e)
+            finally:
+                raw_queue.put(None)
+
+        def filter_stage():
+            nonlocal remaining
+            try:
+                while (item := raw_queue.get()) is not None:
+                    journal, articles = item
+                    if ai_filter is not None:
+                        if remaining is not None:
+                            articles = articles[:remaining]
+                            remaining -= len(articles)
+                        articles = ai_filter.filter_articles(articles) if articles else []
+                    filtered_queue.put((journal, articles))
+            except Exception as e:
+                errors.append(e)
+                # 排空上游队列，等待搜索线程结束
+                while raw_queue.get() is not None:
+                    pass
+            finally:
+                filtered_queue.put(None)
+
+        threads = [
+            threading.Thread(target=search_stage, name="pipeline-search", daemon=True),
+            threading.Thread(target=filter_stage, name="pipeline-filter", daemon=True),
+        ]
+        for thread in threads:
+            thread.start()
+
+        # 推送阶段在当前线程中运行，凑满一次推送的数量即推送
+        filtered_results: Dict[str, List[Dict]] = {}
+        pending: List[Dict] = []
+        success = True
+
+        def flush():
+            nonlocal success
+            if push and pending:
+                # 传入推送时刻的快照，避免推送过程中搜索线程修改字典
+                with results_lock:
+                    snapshot = dict(results)
+                success = push_to_feishu(snapshot, pending, days, self.config) and success
+            pending.clear()
+
+        while (item := filtered_queue.get()) is not None:
+            for article in item[1]:
+                filtered_results.setdefault(article.get('journal', 'Unknown'), []).append(article)
+                pending.append(article)
+                if len(pending) >= push_batch_size:
+                    flush()
+        flush()
+
+        for thread in threads:
+            thread.join()
+        if errors:
+            raise errors[0]
+
+        total_articles = sum(len(articles) for articles in results.values())
+        filtered_count = sum(len(articles) for articles in filtered_results.values())
+        logger.info(f"✅ 流水线完成，共找到 {total_articles} 篇文章，过滤后剩余 {filtered_count} 篇")
+        if push:
+            if success:
+                logger.info("✅ 飞书推送成功")
+            else:
+                logger.error("❌ 飞书推送失败")
+
+        return filtered_results
@@ -0,0 +1,103 @@
+# conftest.py
+"""
+测试公共夹具
+提供基于临时目录的搜索器，以及模拟NCBI E-utilities接口的HTTP会话
+"""
+
+from typing import Dict, List, Optional
+
+import pytest
+import yaml
+
+from pusher.search import ArticleSearcher
+
+
+def pubmed_article_xml(pmid: str, journal: str = "Nature") -> str:
+    """生成一篇PubMed文章的efetch XML片段"""
+    return (
+        f"<PubmedArticle><MedlineCitation><PMID>{pmid}</PMID><Article>"
+        f"<Journal><Title>{journal}</Title></Journal>"
+        f"<ArticleTitle>Title {pmid}</ArticleTitle>"
+        f"<Abstract><AbstractText>single-cell abstract {pmid}</AbstractText></Abstract>"
+        f"<AuthorList><Author><LastName>Theis</LastName><ForeName>Fabian</ForeName></Author></AuthorList>"
+        f"</Article></MedlineCitation></PubmedArticle>"
+    )
+
+
+class FakeResponse:
+    """模拟 requests.Response"""
+
+    def __init__(self, payload=None, content: bytes = b"", status_code: int = 200):
+        self._payload = payload
+        self.content = content
+        self.status_code = status_code
+        self.headers = {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+    def json(self):
+        return self._payload
+
+
+class FakeNCBISession:
+    """
+    模拟NCBI E-utilities接口
+
+    Args:
+        pmids_by_journal: 期刊名称 -> esearch返回的PMID列表
+        broken_fetch_ids: 包含其中任一PMID的efetch请求返回截断的XML
+    """
+
+    def __init__(self, pmids_by_journal: Dict[str, List[str]],
+                 broken_fetch_ids: Optional[set] = None):
+        self.pmids_by_journal = pmids_by_journal
+        self.broken_fetch_ids = broken_fetch_ids or set()
+        self.calls: List[tuple] = []
+
+    def get(self, url, params=None, timeout=None, **kwargs):
+        params = dict(params or {})
+        if url.endswith("esearch.fcgi"):
+            journal = params["term"].split("[Journal]")[0].lstrip("(")
+            self.calls.append(("esearch", journal))
+            pmids = self.pmids_by_journal.get(journal, [])[:int(params["retmax"])]
+            return FakeResponse({"esearchresult": {"idlist": pmids}})
+
+        ids = params["id"].split(",")
+        self.calls.append(("efetch", ids))
+        xml = "<PubmedArticleSet>" + "".join(map(pubmed_article_xml, ids)) + "</PubmedArticleSet>"
+        if self.broken_fetch_ids.intersection(ids):
+            xml = xml[:len(xml) // 2]
+        return FakeResponse(content=xml.encode("utf-8"))
+
+
+@pytest.fixture
+def make_searcher(tmp_path, monkeypatch):
+    """在临时目录中创建搜索器，PubMed缓存写入临时目录"""
+    monkeypatch.chdir(tmp_path)
+
+    def make(journals: List[str], biorxiv: bool = False, **search_config) -> ArticleSearcher:
+        config = {
+            "search_config": {
+                "days": 7,
+                "max_results_per_journal": 20,
+                "http_cache_enabled": False,
+                "pubmed_cache_path": str(tmp_path / "pubmed.sqlite"),
+                **search_config,
+            },
+            "journals": {
+                "pubmed_journals": journals,
+                "biorxiv": {"enabled": biorxiv, "subjects": ["bioinformatics"]},
+            },
+            "keywords": {"any": [], "all": []},
+            "authors": {"include": [], "exclude": []},
+        }
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(yaml.safe_dump(config), encoding="utf-8")
+        searcher = ArticleSearcher(str(config_file), str(tmp_path / "secrets.yaml"))
+        # 测试中不限速
+        searcher._pubmed_rate_limiter.acquire = lambda tokens=1.0: None
+        return searcher
+
+    return make
@@ -0,0 +1,107 @@
+# test_ai_filter.py
+"""AIFilter 的批量评估和预过滤测试"""
+
+import logging
+
+from pusher.ai_filter import AIFilter
+
+
+def make_filter(**overrides) -> AIFilter:
+    config = {
+        "enabled": True,
+        "model": {
+            "provider": "deepseek",
+            "name": "deepseek-chat",
+            "base_url": "https://example.invalid",
+            "api_key": "test-key",
+            "temperature": 0.1,
+            "max_tokens": 1000,
+        },
+        "prompt": "Evaluate: {title}\n{abstract}",
+        "cache_enabled": False,
+        "concurrency": 1,
+    }
+    config.update(overrides)
+    return AIFilter(config)
+
+
+def make_articles(count: int):
+    return [{"title": f"Paper {i}", "abstract": "single-cell", "authors": []} for i in range(count)]
+
+
+def test_batch_request_respects_output_token_cap(monkeypatch):
+    ai_filter = make_filter(batch_size=10)
+    requests_made = []
+
+    def fake_completion(prompt, max_tokens, timeout=None):
+        requests_made.append((max_tokens, timeout))
+        count = prompt.count('"id"')
+        return {"results": [{"id": i, "relevant": True, "score": 8} for i in range(1, count + 1)]}
+
+    monkeypatch.setattr(ai_filter, "_request_completion", fake_completion)
+
+    evaluations = ai_filter._request_evaluations(make_articles(10))
+
+    assert all(e["relevant"] for e in evaluations)
+    # 默认 batch_max_tokens 为8192，每篇1000 token，每批最多8篇
+    assert ai_filter.batch_size == 8
+    assert requests_made == [(8000, 240.0), (2000, 60.0)]
+
+
+def test_batch_missing_results_fall_back_with_warning(monkeypatch, caplog):
+    ai_filter = make_filter(batch_size=3)
+    single_calls = []
+
+    monkeypatch.setattr(
+        ai_filter, "_request_completion",
+        lambda prompt, max_tokens, timeout=None: {"results": [{"id": 1, "relevant": True, "score": 9}]}
+    )
+
+    def fake_single(article):
+        single_calls.append(article["title"])
+        return {"relevant": False, "score": 1}
+
+    monkeypatch.setattr(ai_filter, "_safe_evaluate_article", fake_single)
+
+    with caplog.at_level(logging.WARNING, logger="pusher.ai_filter"):
+        evaluations = ai_filter._request_evaluations(make_articles(3))
+
+    assert [e["score"] for e in evaluations] == [9, 1, 1]
+    assert single_calls == ["Paper 1", "Paper 2"]
+    assert "缺少 2/3" in caplog.text
+
+
+def test_prefilter_is_off_by_default(monkeypatch):
+    ai_filter = make_filter(batch_size=1)
+    evaluated = []
+    monkeypatch.setattr(
+        ai_filter, "_safe_evaluate_article",
+        lambda article: evaluated.append(article["title"]) or {"relevant": True, "score": 7}
+    )
+
+    kept = ai_filter.filter_articles([{"title": "Plant root development", "abstract": "arabidopsis", "authors": []}])
+
+    assert ai_filter.prefilter is False
+    assert evaluated == ["Plant root development"]
+    assert [a["title"] for a in kept] == ["Plant root development"]
+
+
+def test_prefilter_skips_articles_without_area_keywords(monkeypatch, caplog):
+    ai_filter = make_filter(prefilter=True, batch_size=1)
+    evaluated = []
+    monkeypatch.setattr(
+        ai_filter, "_safe_evaluate_article",
+        lambda article: evaluated.append(article["title"]) or {"relevant": True, "score": 7}
+    )
+
+    articles = [
+        {"title": "Plant root development", "abstract": "arabidopsis", "authors": []},
+        {"title": "Aging clocks", "abstract": "senescence in single-cell data", "authors": []},
+    ]
+    with caplog.at_level(logging.INFO, logger="pusher.ai_filter"):
+        kept = ai_filter.filter_articles(articles)
+
+    assert evaluated == ["Aging clocks"]
+    assert [a["title"] for a in kept] == ["Aging clocks"]
+    assert articles[0]["ai_evaluation"]["relevant"] is False
+    assert "预过滤跳过 1/2" in caplog.text
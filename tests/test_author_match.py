@@ -0,0 +1,47 @@
+# test_author_match.py
+"""作者名字匹配测试"""
+
+import pytest
+
+from pusher.author_match import author_names_match, normalize_author
+
+
+@pytest.mark.parametrize("name, expected", [
+    ("Fabian Theis", "fabian theis"),
+    ("Theis, Fabian", "fabian theis"),
+    ("Theis, Fabian J.", "fabian theis"),
+    ("Fabian J. Theis", "fabian theis"),
+    ("  THEIS  ", "theis"),
+    ("", ""),
+    (",", ""),
+])
+def test_normalize_author(name, expected):
+    assert normalize_author(name) == expected
+
+
+@pytest.mark.parametrize("a, b, expected", [
+    ("Fabian Theis", "Fabian J. Theis", True),
+    ("Theis, Fabian", "Fabian Theis", True),
+    ("Fabian Theis", "Theis, Fabian J.", True),
+    ("Theis", "Fabian Theis", True),
+    ("Fabian Theis", "David Theis", False),
+    ("Fabian Theis", "Fabian Baker", False),
+    ("Fabian Theis", "", False),
+])
+def test_author_names_match(a, b, expected):
+    assert author_names_match(a, b) is expected
+    assert author_names_match(b, a) is expected
+
+
+def test_filter_by_authors_uses_last_name_buckets(make_searcher):
+    searcher = make_searcher([])
+    articles = [
+        {"title": "keep", "authors": ["Theis, Fabian J.", "Someone Else"]},
+        {"title": "excluded", "authors": ["Fabian Theis", "David Baker"]},
+        {"title": "unrelated", "authors": ["Anna Li"]},
+    ]
+    author_config = {"mode": "all", "include": ["Fabian Theis"], "exclude": ["Baker, David"]}
+
+    kept = searcher._filter_by_authors(articles, author_config, source="pubmed")
+
+    assert [a["title"] for a in kept] == ["keep"]
@@ -0,0 +1,151 @@
+# test_feishu_pusher.py
+"""FeishuPusher 的推送去重和配置测试"""
+
+import logging
+import time
+import types
+from collections import OrderedDict
+from pathlib import Path
+
+import pytest
+import yaml
+
+from pusher import feishu_pusher
+
+
+@pytest.fixture
+def feishu_config():
+    with open(Path(__file__).resolve().parent.parent / "article_search_config.yaml", encoding="utf-8") as f:
+        return yaml.safe_load(f)["feishu"]
+
+
+def test_dedup_drops_repeated_doi_link_or_title(feishu_config):
+    pusher = feishu_pusher.FeishuPusher(feishu_config)
+    articles = [
+        {"title": "A", "doi": "10.1000/X", "link": "https://a"},
+        {"title": "A, journal version", "doi": "10.1000/x", "link": "https://a2"},
+        {"title": "B", "link": "https://b"},
+        {"title": "B, mirror", "link": "https://b"},
+        {"title": "C"},
+        {"title": "c"},
+    ]
+
+    assert [a["title"] for a in pusher._dedup_articles(articles)] == ["A", "B", "C"]
+
+
+def test_fuzzy_dedup_drops_near_identical_titles(feishu_config):
+    articles = [
+        {"title": "Single-cell atlas of the human lung", "link": "https://a"},
+        {"title": "Single cell atlas of the human lung.", "link": "https://b"},
+        {"title": "Protein structure prediction with diffusion models", "link": "https://c"},
+    ]
+
+    assert len(feishu_pusher.FeishuPusher(feishu_config)._dedup_articles(articles)) == 3
+    feishu_config["push_config"]["fuzzy_dedup"] = True
+    kept = feishu_pusher.FeishuPusher(feishu_config)._dedup_articles(articles)
+    assert [a["link"] for a in kept] == ["https://a", "https://c"]
+
+
+def test_topic_cards_are_sent_in_order(feishu_config, monkeypatch):
+    feishu_config["webhook_url"] = "https://example.invalid/hook"
+    feishu_config["push_config"]["max_articles_per_push"] = 1
+    cards, sent = [], []
+
+    def slow_send(self, card_message):
+        # 第一条消息发送得更慢，并发发送时会乱序
+        time.sleep(0.05 if card_message is cards[0] else 0)
+        sent.append(card_message)
+        return True
+
+    monkeypatch.setattr(feishu_pusher.FeishuPusher, "_send_to_feishu", slow_send)
+    monkeypatch.setattr(
+        feishu_pusher.FeishuPusher, "_build_multi_topic_message",
+        lambda self, body, *args: cards.append(body) or body
+    )
+    articles = [{"title": f"Paper {i}", "link": f"https://example.org/{i}"} for i in range(60)]
+    pusher = feishu_pusher.FeishuPusher(feishu_config)
+
+    assert pusher._push_by_topics({"nature": articles}, articles, 7)
+
+    assert len(cards) > 1
+    assert sent == cards
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(feishu_pusher, "time", types.SimpleNamespace(monotonic=lambda: now[0], sleep=time.sleep))
+    monkeypatch.setattr(feishu_pusher, "_recent_pushes", OrderedDict())
+    return now
+
+
+def test_recent_pushes_drop_entries_outside_window(clock):
+    feishu_pusher._remember_push(b"a", ttl=60)
+    clock[0] += 30
+    feishu_pusher._remember_push(b"b", ttl=60)
+    clock[0] += 40
+    feishu_pusher._remember_push(b"c", ttl=60)
+
+    assert list(feishu_pusher._recent_pushes) == [b"b", b"c"]
+
+
+def test_recent_pushes_are_bounded(clock, monkeypatch):
+    monkeypatch.setattr(feishu_pusher, "_MAX_RECENT_PUSHES", 3)
+    for i in range(10):
+        feishu_pusher._remember_push(bytes([i]), ttl=3600)
+
+    assert list(feishu_pusher._recent_pushes) == [bytes([7]), bytes([8]), bytes([9])]
+
+
+def test_repushed_digest_moves_to_newest(clock):
+    feishu_pusher._remember_push(b"a", ttl=60)
+    clock[0] += 10
+    feishu_pusher._remember_push(b"b", ttl=60)
+    clock[0] += 10
+    feishu_pusher._remember_push(b"a", ttl=60)
+    clock[0] += 55
+    feishu_pusher._remember_push(b"c", ttl=60)
+
+    assert list(feishu_pusher._recent_pushes) == [b"a", b"c"]
+
+
+def test_identical_cards_are_sent_unless_dedupe_is_enabled(feishu_config, clock, monkeypatch, caplog):
+    feishu_config["webhook_url"] = "https://example.invalid/hook"
+    posts = []
+    monkeypatch.setattr(feishu_pusher.FeishuPusher, "_post", lambda self, url, body: posts.append(body) or True)
+    card = {"card": {"elements": [{"tag": "hr"}, {"tag": "div", "text": {"tag": "lark_md", "content": "a"}}]}}
+
+    pusher = feishu_pusher.FeishuPusher(feishu_config)
+    assert pusher._send_to_feishu(card) and pusher._send_to_feishu(card)
+    assert len(posts) == 2
+
+    feishu_config["push_config"]["dedupe_ttl_seconds"] = 60
+    pusher = feishu_pusher.FeishuPusher(feishu_config)
+    with caplog.at_level(logging.WARNING, logger="pusher.feishu_pusher"):
+        assert pusher._send_to_feishu(card) and pusher._send_to_feishu(card)
+    assert len(posts) == 3
+    assert "跳过推送" in caplog.text
+
+
+def test_zero_abstract_length_warns_once(feishu_config, monkeypatch, caplog):
+    feishu_config["push_config"]["abstract_max_length"] = 0
+    monkeypatch.setattr(feishu_pusher, "_abstract_length_warned", False)
+
+    with caplog.at_level(logging.WARNING, logger="pusher.feishu_pusher"):
+        pushers = [feishu_pusher.FeishuPusher(feishu_config) for _ in range(3)]
+
+    assert all(p.abstract_max_length == feishu_pusher._DEFAULT_ABSTRACT_MAX_LENGTH for p in pushers)
+    assert caplog.text.count("abstract_max_length") == 1
+
+
+def test_negative_abstract_length_keeps_full_abstract(feishu_config, caplog):
+    feishu_config["push_config"]["abstract_max_length"] = -1
+    abstract = "single-cell " * 100
+
+    with caplog.at_level(logging.WARNING, logger="pusher.feishu_pusher"):
+        pusher = feishu_pusher.FeishuPusher(feishu_config)
+    content = pusher._format_article_markdown({"title": "A", "abstract": abstract}, 1)
+
+    assert pusher.abstract_max_length == -1
+    assert abstract in content
+    assert "abstract_max_length" not in caplog.text
@@ -0,0 +1,43 @@
+# test_llm_cache.py
+"""LLMCache 测试"""
+
+import pytest
+
+from pusher import llm_cache
+from pusher.llm_cache import LLMCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = LLMCache(str(tmp_path / "llm.sqlite"))
+    yield cache
+    cache.close()
+
+
+def test_make_key_depends_on_every_parameter():
+    base = LLMCache.make_key("model", "prompt", 0.1, 1000)
+
+    assert base == LLMCache.make_key("model", "  prompt\n", 0.1, 1000)
+    assert base != LLMCache.make_key("other", "prompt", 0.1, 1000)
+    assert base != LLMCache.make_key("model", "prompt", 0.2, 1000)
+    assert base != LLMCache.make_key("model", "prompt", 0.1, 2000)
+
+
+def test_round_trip_and_stats(cache):
+    key = LLMCache.make_key("model", "prompt", 0.1, 1000)
+
+    assert cache.get(key) is None
+    cache.set(key, {"relevant": True, "score": 8})
+
+    assert cache.get(key) == {"relevant": True, "score": 8}
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_expired_entries_are_removed(cache, monkeypatch):
+    key = LLMCache.make_key("model", "prompt", 0.1, 1000)
+    cache.set(key, {"relevant": True})
+
+    now = llm_cache.time.time()
+    monkeypatch.setattr(llm_cache.time, "time", lambda: now + cache.ttl + 1)
+
+    assert cache.get(key) is None
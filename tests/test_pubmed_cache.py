@@ -0,0 +1,48 @@
+# test_pubmed_cache.py
+"""PubMedCache 测试"""
+
+import pytest
+
+from pusher.pubmed_cache import PubMedCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = PubMedCache(str(tmp_path / "pubmed.sqlite"))
+    yield cache
+    cache.close()
+
+
+def search_params(term: str = "(nature[Journal]) AND (2024/01/01:2024/01/08[dp])", retmax: int = 5):
+    return {"db": "pubmed", "term": term, "retmax": retmax, "retmode": "json", "sort": "relevance"}
+
+
+def test_query_key_includes_retmax(cache):
+    cache.set_query(search_params(retmax=5), ["1", "2"])
+
+    assert cache.get_query(search_params(retmax=5)) == ["1", "2"]
+    assert cache.get_query(search_params(retmax=50)) is None
+
+
+def test_query_key_includes_date_window(cache):
+    cache.set_query(search_params(), ["1"])
+
+    assert cache.get_query(search_params(term="(nature[Journal]) AND (2024/01/02:2024/01/09[dp])")) is None
+
+
+def test_query_cache_disabled_with_non_positive_ttl(tmp_path):
+    cache = PubMedCache(str(tmp_path / "pubmed.sqlite"), query_ttl=0)
+    cache.set_query(search_params(), ["1"])
+
+    assert cache.get_query(search_params()) is None
+    cache.close()
+
+
+def test_articles_round_trip_across_sql_chunks(cache, monkeypatch):
+    monkeypatch.setattr("pusher.pubmed_cache._MAX_SQL_PARAMS", 2)
+    cache.set_articles({str(i): {"pmid": str(i), "title": f"T{i}"} for i in range(5)})
+
+    found = cache.get_articles(["0", "1", "2", "3", "4", "99"])
+
+    assert sorted(found) == ["0", "1", "2", "3", "4"]
+    assert (cache.hits, cache.misses) == (5, 1)
@@ -0,0 +1,156 @@
+# test_search.py
+"""ArticleSearcher 的搜索和流水线测试"""
+
+import threading
+
+import pytest
+
+from pusher import search
+from tests.conftest import FakeNCBISession, pubmed_article_xml
+
+
+def test_pipeline_pushes_filtered_articles_in_batches(make_searcher, monkeypatch):
+    searcher = make_searcher(["nature", "science"])
+    searcher.config["feishu"] = {"enabled": True, "push_config": {"max_articles_per_push": 2}}
+    found = {
+        "nature": [{"title": "a", "journal": "nature"}, {"title": "b", "journal": "nature"}],
+        "science": [{"title": "c", "journal": "science"}],
+    }
+    pushes = []
+
+    def fake_push(all_results, articles, days, config):
+        pushes.append([article["title"] for article in articles])
+        return True
+
+    monkeypatch.setattr(searcher, "_iter_journal_searches", lambda *args: iter(found.items()))
+    monkeypatch.setattr("pusher.search.push_to_feishu", fake_push)
+
+    filtered = searcher.run_pipeline(days=7)
+
+    assert filtered == found
+    # 凑满 max_articles_per_push 即推送，剩余文章在搜索结束后推送
+    assert pushes == [["a", "b"], ["c"]]
+
+
+def test_pipeline_pushes_snapshot_of_results(make_searcher, monkeypatch):
+    searcher = make_searcher(["nature", "science"])
+    searcher.config["feishu"] = {"enabled": True, "push_config": {"max_articles_per_push": 1}}
+    pushed = threading.Event()
+
+    def slow_search(*args):
+        yield "nature", [{"title": "a", "journal": "nature"}]
+        # 第一次推送时搜索线程仍在运行
+        assert pushed.wait(5)
+        yield "science", [{"title": "b", "journal": "science"}]
+
+    calls = []
+
+    def fake_push(all_results, articles, days, config):
+        calls.append((all_results, len(all_results)))
+        pushed.set()
+        return True
+
+    monkeypatch.setattr(searcher, "_iter_journal_searches", slow_search)
+    monkeypatch.setattr("pusher.search.push_to_feishu", fake_push)
+
+    filtered = searcher.run_pipeline(days=7)
+
+    assert set(filtered) == {"nature", "science"}
+    assert len(calls) == 2
+    # 推送拿到的是推送时刻的快照，之后的搜索结果不会写入其中
+    assert [len(all_results) for all_results, _ in calls] == [count for _, count in calls] == [1, 2]
+
+
+def test_serial_search_and_pipeline_use_configured_max_results(make_searcher):
+    searcher = make_searcher(["nature"], max_results_per_journal=3, pubmed_cache_enabled=False)
+    searcher._session = FakeNCBISession({"nature": [str(i) for i in range(1, 11)]})
+
+    assert len(searcher.search_articles(days=7)["nature"]) == 3
+    # 流水线结果按文章的期刊字段分组
+    assert sum(map(len, searcher.run_pipeline(days=7, push=False).values())) == 3
+
+
+def test_larger_max_results_is_not_served_from_smaller_cached_search(make_searcher):
+    searcher = make_searcher(["nature"])
+    session = FakeNCBISession({"nature": [str(i) for i in range(1, 11)]})
+    searcher._session = session
+
+    small = searcher.search_articles(days=7, max_results_per_journal=2)
+    large = searcher.search_articles(days=7, max_results_per_journal=10)
+
+    assert len(small["nature"]) == 2
+    assert len(large["nature"]) == 10
+    assert [kind for kind, _ in session.calls].count("esearch") == 2
+
+
+def test_batch_search_fetches_shared_pmids_once(make_searcher):
+    searcher = make_searcher(["nature", "science"])
+    session = FakeNCBISession({"nature": ["1", "2", "3"], "science": ["3", "4"]})
+    searcher._session = session
+
+    results = searcher.search_articles(days=7, max_results_per_journal=10)
+
+    assert [a["pmid"] for a in results["nature"]] == ["1", "2", "3"]
+    assert [a["pmid"] for a in results["science"]] == ["3", "4"]
+    fetched = [ids for kind, ids in session.calls if kind == "efetch"]
+    assert fetched == [["1", "2", "3", "4"]]
+
+
+def test_truncated_efetch_only_loses_its_chunk(make_searcher, monkeypatch):
+    monkeypatch.setattr("pusher.search._EFETCH_BATCH_SIZE", 2)
+    searcher = make_searcher(["nature", "science"])
+    searcher._session = FakeNCBISession(
+        {"nature": ["1", "2"], "science": ["3", "4"]},
+        broken_fetch_ids={"3"}
+    )
+
+    results = searcher.search_articles(days=7, max_results_per_journal=10)
+
+    assert [a["pmid"] for a in results["nature"]] == ["1", "2"]
+    assert results["science"] == []
+
+
+def test_fetch_failure_does_not_drop_other_sources(make_searcher, monkeypatch):
+    searcher = make_searcher(["nature"], biorxiv=True)
+    searcher._session = FakeNCBISession({"nature": ["1"]})
+
+    def broken_fetch(pmids):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(searcher, "_fetch_pubmed_articles", broken_fetch)
+    monkeypatch.setattr(searcher, "_search_biorxiv", lambda *args: [{"title": "preprint", "authors": []}])
+
+    results = searcher.search_articles(days=7, max_results_per_journal=10)
+
+    assert results["nature"] == []
+    assert results["biorxiv"] == [{"title": "preprint", "authors": []}]
+
+
+def test_pubmed_xml_entities_are_not_expanded_with_lxml(make_searcher):
+    etree = pytest.importorskip("lxml.etree")
+    assert search.ET is etree
+    xml = (
+        '<?xml version="1.0"?><!DOCTYPE PubmedArticleSet [<!ENTITY injected "EXPANDED">]>'
+        '<PubmedArticleSet>' + pubmed_article_xml("1").replace("Title 1", "Title &injected;")
+        + '</PubmedArticleSet>'
+    )
+
+    articles = make_searcher([])._parse_pubmed_xml(xml)
+
+    assert [a["pmid"] for a in articles] == ["1"]
+    assert "EXPANDED" not in articles[0]["title"]
+
+
+def test_rss_entities_are_not_expanded_with_lxml():
+    etree = pytest.importorskip("lxml.etree")
+    assert search.ET is etree
+    rss = (
+        b'<?xml version="1.0"?><!DOCTYPE rss [<!ENTITY injected "EXPANDED">]>'
+        b'<rss version="2.0"><channel><item><title>Preprint &injected;</title>'
+        b'<link>https://example.org/1</link></item></channel></rss>'
+    )
+
+    entries = search._parse_rss_items(rss)
+
+    assert [e["link"] for e in entries] == ["https://example.org/1"]
+    assert "EXPANDED" not in entries[0]["title"]